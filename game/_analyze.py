@@ -0,0 +1,82 @@
+import os, sys
+sys.stdout.reconfigure(encoding='utf-8')
+
+from _instrument import Profiler
+from _stream import external_sort, iter_rows, join, where, write_lines
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+UNITS_PATH = os.path.join(HERE, 'data', 'units.csv')
+SKILLS_PATH = os.path.join(HERE, 'data', 'skills.csv')
+OUT_PATH = os.path.join(HERE, '_unit_skill_map.txt')
+ROLES = ['TANKER','FIGHTER','MAGE','ARCHER','ASSASSIN','SUPPORT']
+ROLE_ORDER = {r: i for i, r in enumerate(ROLES)}
+MISSING = ('?', '?', '?')
+
+
+def iter_units(path):
+    """(role_idx, tier, uid, name, skill) cho từng unit thuộc ROLES."""
+    header, rows = iter_rows(path)
+    idx = {h:i for i,h in enumerate(header)}
+    for row in rows:
+        if len(row) < 17: continue
+        role = ROLE_ORDER.get(row[idx['classType']])
+        if role is None: continue
+        yield (role, int(row[idx['tier']]), row[idx['id']], row[idx['name']], row[idx['skillId']])
+
+
+def is_skill_row(row):
+    return len(row) > 0 and row[0].strip() and not row[0].startswith('**') and not row[0].startswith('-')
+
+
+def skill_index(path):
+    """sid -> (base, scale, dmgType): chỉ giữ các cột report cần, không giữ cả dòng."""
+    _, rows = iter_rows(path)
+    index = {}
+    for row in where(rows, is_skill_row):
+        base = row[6] if len(row)>6 else ''
+        scale = row[8] if len(row)>8 else ''
+        dmg_type = row[5] if len(row)>5 else ''
+        index[row[0].strip()] = (base, scale, dmg_type)
+    return index
+
+
+def format_report(joined):
+    """Sinh từng dòng report; `joined` đã sort theo (role, tier)."""
+    next_role = 0
+    for (role, t, uid, name, skill), sd in joined:
+        while next_role <= role:
+            yield f'\n=== {ROLES[next_role]} ==='
+            next_role += 1
+        exists = '✅' if sd is not None else '❌'
+        base, scale, dmg_type = sd or MISSING
+        stats = f"base={base} scale={scale} type={dmg_type}"
+        yield f'  T{t} {uid:25s} {exists} {skill:35s} {stats}'
+    for role in ROLES[next_role:]:
+        yield f'\n=== {role} ==='
+
+
+def main(units_path=UNITS_PATH, skills_path=SKILLS_PATH, out_path=OUT_PATH, prof=None):
+    prof = prof or Profiler(None)
+
+    with prof.stage('parse') as st:
+        index = skill_index(skills_path)
+        st.rows = len(index)
+
+    # units -> sort (role, tier) -> join skill -> format -> ghi, tất cả streaming;
+    # mỗi generator là một stage riêng, 'write' chỉ còn thời gian ghi file
+    with prof.stage('write') as st:
+        units = prof.stream('load', iter_units(units_path))
+        ordered = prof.stream('sort', external_sort(units, key=lambda u: (u[0], u[1])))
+        joined = prof.stream('validate', join(ordered, index, key=lambda u: u[4]))
+        n = write_lines(format_report(joined), out_path)
+        st.rows = n
+    print(f'Written {n} lines')
+    return 0
+
+
+if __name__ == '__main__':
+    prof = Profiler.from_argv('analyze')
+    code = main(prof=prof)
+    if prof.write():
+        print(f'📊 Profile written to {prof.out_path}')
+    sys.exit(code)
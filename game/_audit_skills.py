@@ -0,0 +1,89 @@
+"""
+Audit: so sanh star descriptions trong skills.csv voi logic code
+Chay: python _audit_skills.py [--profile report.json [--profile-memory]]
+"""
+import os, re, sys
+
+sys.stdout.reconfigure(encoding='utf-8')
+
+from _instrument import Profiler
+from _stream import iter_dicts, write_lines
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SKILLS_PATH = os.path.join(HERE, 'data', 'skills.csv')
+OUT_PATH = os.path.join(HERE, '_audit_result.txt')
+
+def parse_star_details(desc):
+    results = {}
+    parts = re.split(r'(?=\d[★⭐])', desc)
+    for part in parts:
+        m = re.match(r'^(\d)[★⭐]\s*(.+?)$', part.strip())
+        if m:
+            star = int(m.group(1))
+            text = m.group(2).strip().rstrip(';.,')
+            results[star] = text
+    return results
+
+def extract_numbers(text):
+    info = {}
+    pcts = re.findall(r'(\d+)%', text)
+    if pcts: info['pct'] = [int(x) for x in pcts]
+    turns = re.findall(r'(\d+)\s*luot', text.replace('ợ','o').replace('ượ','uo'))
+    if not turns:
+        turns = re.findall(r'(\d+)\s*l', text)
+    if turns: info['turns'] = [int(x) for x in turns[:2]]
+    targets = re.findall(r'(\d+)\s*(?:dong minh|muc tieu|ke dich|d)', text.replace('ồ','o').replace('ụ','u'))
+    if 'toan doi' in text.replace('à','a').replace('ộ','o') or 'toan bo' in text.replace('à','a').replace('ộ','o'):
+        info['global'] = True
+    return info
+
+def audit_entries(skills):
+    """Moi skill co mo ta sao -> (sid, effect, base, scale, turns, maxT, maxH, star_details)"""
+    for skill in skills:
+        sid = skill['id'].strip()
+        effect = skill.get('effect','').strip()
+        desc = skill.get('descriptionVi','').strip()
+        base = skill.get('base','').strip()
+        scale = skill.get('scale','').strip()
+        turns = skill.get('turns','').strip()
+        maxT = skill.get('maxTargets','').strip()
+        maxH = skill.get('maxHits','').strip()
+
+        star_details = parse_star_details(desc)
+        if not star_details:
+            continue
+        yield (sid, effect, base, scale, turns, maxT, maxH, star_details)
+
+def format_audit(entries):
+    """Sinh tung khoi text cua report, ghi ngay khi co"""
+    yield "="*80 + "\n"
+    yield "AUDIT: Skill Star Descriptions\n"
+    yield "="*80 + "\n"
+
+    for sid, effect, base, scale, turns, maxT, maxH, star_details in entries:
+        yield f"\n{'_'*60}\n"
+        yield f"{sid} (effect: {effect})\n"
+        yield f"  CSV: base={base} scale={scale} turns={turns} maxT={maxT} maxH={maxH}\n"
+
+        for star in [1, 2, 3]:
+            if star in star_details:
+                text = star_details[star]
+                yield f"  *{star}: {text}\n"
+
+def main(skills_path=SKILLS_PATH, out_path=OUT_PATH, prof=None):
+    prof = prof or Profiler(None)
+
+    # doc -> parse sao -> format -> ghi, streaming tung skill; moi generator mot stage
+    with prof.stage('write') as st:
+        skills = prof.stream('load', iter_dicts(skills_path))
+        entries = prof.stream('parse', audit_entries(skills))
+        st.rows = write_lines(format_audit(entries), out_path, sep='')
+    print(f"Done! Written to {os.path.basename(out_path)}")
+    return 0
+
+if __name__ == '__main__':
+    prof = Profiler.from_argv('audit_skills')
+    code = main(prof=prof)
+    if prof.write():
+        print(f'📊 Profile written to {prof.out_path}')
+    sys.exit(code)
@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark scaling: sinh dataset units/skills/synergies giả lập cỡ lớn (độ thưa
+cột giống dữ liệu thật, dựa trên COLS + make_row) rồi đo các path build,
+analyze, audit và flatted round-trip ở nhiều kích thước.
+
+Chạy:
+  python _bench_scaling.py [--sizes 1000,5000,20000] [--repeat 3] [--budget 30]
+                           [--json out.json] [--baseline base.json] [--save-baseline]
+
+--budget: nếu một path chạy (hoặc dự đoán theo số mũ scaling đã đo sẽ chạy) lâu hơn
+N giây thì bỏ qua các size lớn hơn — tránh kẹt ở path O(n^2) như flatted.
+--baseline: so sánh với kết quả đã lưu (mặc định _bench_baseline.json); --save-baseline
+ghi kết quả hiện tại vào đó. Baseline phụ thuộc máy nên không commit: tạo một lần trên
+máy đo trước khi sửa code rồi chạy lại để so, ví dụ
+  python _bench_scaling.py --save-baseline      # trên commit gốc
+  python _bench_scaling.py                      # sau khi sửa, exit 1 nếu chậm hơn 20%
+Skill giả lập lấy profile cột từ _skill_data.ALL_SKILLS (khớp data/skills.csv,
+xem tests/py/test_build_skills.py).
+"""
+import contextlib, csv, io, json, math, os, random, shutil, sys, tempfile, time
+sys.stdout.reconfigure(encoding='utf-8')
+
+import _analyze, _audit_skills, _build_skills
+from _skill_data import ALL_SKILLS, COLS, make_row
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(HERE, 'data')
+FLATTED_DIR = os.path.join(HERE, 'node_modules', 'flatted', 'python')
+BASELINE_PATH = os.path.join(HERE, '_bench_baseline.json')
+DEFAULT_SIZES = [1000, 5000, 20000]
+REGRESSION = 1.2  # chậm hơn baseline 20% thì đánh dấu
+MISSING_SKILL_RATE = 0.01
+
+
+def _read_dicts(path):
+    with open(path, encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        return reader.fieldnames, list(reader)
+
+
+def _profile(rows, cols):
+    """Tỉ lệ cột có giá trị và pool giá trị của từng cột từ dữ liệu thật."""
+    fill, pool = {}, {}
+    for c in cols:
+        vals = [r[c] for r in rows if r.get(c, '') != '']
+        fill[c] = len(vals) / len(rows) if rows else 0.0
+        pool[c] = vals or ['']
+    return fill, pool
+
+
+class Synth:
+    """Sinh dữ liệu giả lập từ profile của units.csv / skills / synergies.csv thật."""
+
+    def __init__(self, seed=1):
+        self.rng = random.Random(seed)
+        self.skill_fill, self.skill_pool = _profile(ALL_SKILLS, COLS)
+        self.unit_cols, units = _read_dicts(os.path.join(DATA_DIR, 'units.csv'))
+        self.unit_fill, self.unit_pool = _profile(units, self.unit_cols)
+        self.syn_cols, self.synergies = _read_dicts(os.path.join(DATA_DIR, 'synergies.csv'))
+
+    def skills(self, n):
+        rng, fill, pool = self.rng, self.skill_fill, self.skill_pool
+        out = []
+        for i in range(n):
+            kw = {c: rng.choice(pool[c]) for c in COLS[1:] if rng.random() < fill[c]}
+            kw['id'] = f'syn_skill_{i}'
+            out.append(make_row(**kw))
+        return out
+
+    def units(self, n, n_skills):
+        rng, fill, pool = self.rng, self.unit_fill, self.unit_pool
+        out = []
+        for i in range(n):
+            row = {c: (rng.choice(pool[c]) if rng.random() < fill[c] else '') for c in self.unit_cols}
+            row['id'] = f'syn_unit_{i}'
+            row['tier'] = str(rng.randint(1, 5))
+            row['classType'] = rng.choice(_analyze.ROLES)
+            if rng.random() < MISSING_SKILL_RATE:
+                row['skillId'] = f'missing_skill_{i}'
+            else:
+                row['skillId'] = f'syn_skill_{rng.randrange(n_skills)}'
+            out.append(row)
+        return out
+
+    def synergy_rows(self, n):
+        base = self.synergies
+        out = []
+        for i in range(n):
+            row = dict(base[i % len(base)])
+            row['id'] = f"{row['id']}_{i // len(base)}"
+            out.append(row)
+        return out
+
+    def write(self, n, out_dir):
+        skills = self.skills(n)
+        units = self.units(n, n)
+        synergies = self.synergy_rows(n)
+        for name, cols, rows in (('skills.csv', COLS, skills),
+                                 ('units.csv', self.unit_cols, units),
+                                 ('synergies.csv', self.syn_cols, synergies)):
+            with open(os.path.join(out_dir, name), 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=cols, quoting=csv.QUOTE_MINIMAL)
+                writer.writeheader()
+                writer.writerows(rows)
+        return {'skills': skills, 'units': units, 'synergies': synergies}
+
+
+def _load_flatted():
+    if FLATTED_DIR not in sys.path:
+        sys.path.insert(0, FLATTED_DIR)
+    try:
+        import flatted
+    except ImportError:
+        return None
+    return flatted
+
+
+# ── Các path được đo: fn(data, dir) -> số dòng đã xử lý ──
+
+def path_build(data, d):
+    rows = data['skills']
+    if _build_skills.validate(rows, COLS):
+        raise RuntimeError('synthetic skills không qua schema')
+    path = os.path.join(d, 'build_skills.csv')
+    _build_skills.write_skills(rows, COLS, path)
+    return len(_build_skills.read_back(path))
+
+
+def path_analyze(data, d):
+    _analyze.main(units_path=os.path.join(d, 'units.csv'),
+                  skills_path=os.path.join(d, 'skills.csv'),
+                  out_path=os.path.join(d, 'unit_skill_map.txt'))
+    return len(data['units']) + len(data['skills'])
+
+
+def path_audit(data, d):
+    _audit_skills.main(skills_path=os.path.join(d, 'skills.csv'),
+                       out_path=os.path.join(d, 'audit_result.txt'))
+    return len(data['skills'])
+
+
+def make_path_flatted(flatted):
+    def path_flatted(data, d):
+        catalog = {k: [dict(r) for r in v] for k, v in data.items()}
+        back = flatted.parse(flatted.stringify(catalog))
+        n = sum(len(v) for v in back.values())
+        if n != sum(len(v) for v in data.values()):
+            raise RuntimeError('flatted round-trip mất dòng')
+        return n
+    return path_flatted
+
+
+def _time(fn, data, d, repeat):
+    best, rows = math.inf, 0
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            t0 = time.perf_counter()
+            rows = fn(data, d)
+            best = min(best, time.perf_counter() - t0)
+    return best, rows
+
+
+def _slope(points):
+    """Số mũ scaling giữa 2 size liên tiếp: t ~ n^k (k=1 là tuyến tính)."""
+    out = []
+    for (n0, t0), (n1, t1) in zip(points, points[1:]):
+        out.append(round(math.log(t1 / t0) / math.log(n1 / n0), 3) if t0 > 0 and t1 > 0 else None)
+    return out
+
+
+def run(sizes, repeat=3, budget=30.0, seed=1):
+    paths = [('build', path_build), ('analyze', path_analyze), ('audit', path_audit)]
+    flatted = _load_flatted()
+    if flatted is not None:
+        paths.append(('flatted_roundtrip', make_path_flatted(flatted)))
+    else:
+        print('⚠️ flatted không có (npm install chưa chạy?) — bỏ qua flatted_roundtrip')
+
+    synth = Synth(seed)
+    results = {name: [] for name, _ in paths}
+    over_budget = set()
+    last = {}
+    for i, n in enumerate(sizes):
+        d = tempfile.mkdtemp(prefix=f'bench_{n}_')
+        try:
+            data = synth.write(n, d)
+            for name, fn in paths:
+                if name in over_budget:
+                    results[name].append({'size': n, 'skipped': True})
+                    continue
+                secs, rows = _time(fn, data, d, repeat)
+                results[name].append({'size': n, 'seconds': round(secs, 6), 'rows': rows,
+                                      'rows_per_s': round(rows / secs) if secs > 0 else None})
+                prev = last.get(name)
+                last[name] = (n, secs)
+                nxt = sizes[i + 1] if i + 1 < len(sizes) else None
+                if nxt is None:
+                    continue
+                k = _slope([prev, (n, secs)])[0] if prev else 1.0
+                if secs > budget or secs * (nxt / n) ** max(k or 1.0, 1.0) > budget:
+                    over_budget.add(name)
+        finally:
+            shutil.rmtree(d, ignore_errors=True)
+
+    for name, pts in results.items():
+        timed = [(p['size'], p['seconds']) for p in pts if not p.get('skipped')]
+        for p, k in zip(pts[1:], _slope(timed)):
+            p['scaling_exponent'] = k
+    return {'sizes': sizes, 'repeat': repeat, 'results': results}
+
+
+def compare(report, baseline):
+    """Gắn tỉ lệ thời gian so với baseline (>1 là chậm hơn) vào từng điểm đo."""
+    regressions = []
+    for name, pts in report['results'].items():
+        base = {p['size']: p for p in baseline.get('results', {}).get(name, []) if not p.get('skipped')}
+        for p in pts:
+            b = base.get(p['size'])
+            if p.get('skipped') or not b or not b['seconds']:
+                continue
+            p['vs_baseline'] = round(p['seconds'] / b['seconds'], 3)
+            if p['vs_baseline'] > REGRESSION:
+                regressions.append((name, p['size'], p['vs_baseline']))
+    return regressions
+
+
+def print_report(report):
+    print(f"{'path':20s} {'size':>8s} {'seconds':>10s} {'rows/s':>12s} {'k':>6s} {'vs base':>8s}")
+    for name, pts in report['results'].items():
+        for p in pts:
+            if p.get('skipped'):
+                print(f"{name:20s} {p['size']:>8d} {'skipped (over budget)':>39s}")
+                continue
+            k = p.get('scaling_exponent')
+            vb = p.get('vs_baseline')
+            print(f"{name:20s} {p['size']:>8d} {p['seconds']:>10.4f} {p['rows_per_s'] or 0:>12,d} "
+                  f"{'' if k is None else k:>6} {'' if vb is None else f'{vb:.2f}x':>8s}")
+
+
+def _arg(argv, flag, default=None):
+    if flag in argv:
+        i = argv.index(flag)
+        return argv[i + 1]
+    return default
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    sizes = [int(x) for x in _arg(argv, '--sizes', ','.join(map(str, DEFAULT_SIZES))).split(',')]
+    repeat = int(_arg(argv, '--repeat', 3))
+    budget = float(_arg(argv, '--budget', 30))
+    baseline_path = _arg(argv, '--baseline', BASELINE_PATH)
+    json_path = _arg(argv, '--json')
+
+    report = run(sizes, repeat=repeat, budget=budget)
+    regressions = []
+    if '--save-baseline' not in argv:
+        if os.path.exists(baseline_path):
+            with open(baseline_path, encoding='utf-8') as f:
+                regressions = compare(report, json.load(f))
+        else:
+            print(f'⚠️ chưa có baseline {baseline_path} — chạy với --save-baseline để tạo')
+    print_report(report)
+
+    if json_path:
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f'📊 Report written to {json_path}')
+    if '--save-baseline' in argv:
+        with open(baseline_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f'✅ Baseline saved to {baseline_path}')
+    for name, n, ratio in regressions:
+        print(f'❌ REGRESSION {name} @ {n}: {ratio:.2f}x baseline')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+Build script: sinh data/skills.csv sạch từ _skill_data.py (ghi đè file đó — sửa skill
+thì sửa ở _skill_data.py, tests/py/test_build_skills.py kiểm tra hai bên khớp nhau)
+Chạy: python _build_skills.py [--profile report.json [--profile-memory]]
+"""
+import csv, os, sys
+sys.stdout.reconfigure(encoding='utf-8')
+
+from _instrument import Profiler
+from _schema import columns_of_dicts, format_issue, validate_skills
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+OUT_PATH = os.path.join(HERE, 'data', 'skills.csv')
+
+
+def validate(rows, cols):
+    """Schema + trùng id cho toàn bộ skill, validate theo cột."""
+    return validate_skills(columns_of_dicts(rows, cols))
+
+
+def write_skills(rows, cols, path):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=cols, quoting=csv.QUOTE_MINIMAL, lineterminator='\n')
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+
+
+def read_back(path):
+    with open(path, encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        return list(reader)
+
+
+def main(out_path=OUT_PATH, prof=None):
+    prof = prof or Profiler(None)
+
+    with prof.stage('load') as st:
+        from _skill_data import ALL_SKILLS, COLS
+        st.rows = len(ALL_SKILLS)
+
+    # Validate schema + uniqueness
+    with prof.stage('validate') as st:
+        issues = validate(ALL_SKILLS, COLS)
+        st.rows = len(ALL_SKILLS)
+    if issues:
+        for x in issues:
+            print(format_issue(x))
+        print(f'❌ {len(issues)} schema errors')
+        return 1
+    print(f'✅ {len(ALL_SKILLS)} skills, schema OK, 0 duplicates')
+
+    # Write CSV
+    with prof.stage('write') as st:
+        write_skills(ALL_SKILLS, COLS, out_path)
+        st.rows = len(ALL_SKILLS)
+    print(f'✅ Written to {out_path}')
+
+    # Quick verify: re-read and check IDs
+    with prof.stage('parse') as st:
+        rows = read_back(out_path)
+        st.rows = len(rows)
+    print(f'✅ Verified: {len(rows)} rows in CSV')
+    return 0
+
+
+if __name__ == '__main__':
+    prof = Profiler.from_argv('build_skills')
+    code = main(prof=prof)
+    if prof.write():
+        print(f'📊 Profile written to {prof.out_path}')
+    sys.exit(code)
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+"""
+Daemon giữ catalog units/skills/synergies (đã parse + index) trong RAM, trả lời
+query qua HTTP localhost hoặc Unix socket. Tự reload khi file CSV thay đổi
+(so mtime, tối đa mỗi RELOAD_CHECK_S giây), kết quả query qua LRU cache.
+
+Chạy:  python _catalog_daemon.py [--port 8765] [--unix /tmp/catalog.sock]
+Query: GET /unit/<id>                    unit theo id
+       GET /skill/<id>                   skill theo id
+       GET /skills?effect=<effect>       skill theo effect
+       GET /synergy?group=CLASS&id=TANKER&count=3   mốc synergy đang kích hoạt
+       GET /unit-skills[?id=<unit>]      map unit -> skill
+       GET /stats                        thông tin catalog + cache
+Từ script: from _catalog_daemon import query; query('/unit/bear_ancient')
+"""
+import http.client, json, os, signal, socket, socketserver, sys, threading, time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from _stream import iter_dicts
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(HERE, 'data')
+FILES = ('units.csv', 'skills.csv', 'synergies.csv')
+HOST = '127.0.0.1'
+PORT = 8765
+RELOAD_CHECK_S = 0.5
+CACHE_SIZE = 4096
+
+
+def _read_table(path):
+    """Dòng thiếu / thừa ô (file đang ghi dở) -> ValueError thay vì ô None lọt vào index."""
+    rows = []
+    for i, row in enumerate(iter_dicts(path), start=2):
+        if None in row or None in row.values():
+            raise ValueError(f'{os.path.basename(path)}:{i}: số ô khác header')
+        rows.append(row)
+    return rows
+
+
+class Catalog:
+    """Các bảng + index dựng một lần từ 3 file CSV."""
+
+    def __init__(self, data_dir=DATA_DIR):
+        t0 = time.perf_counter()
+        self.data_dir = data_dir
+        self.mtimes = self.stat_files(data_dir)
+        units = _read_table(os.path.join(data_dir, 'units.csv'))
+        skills = _read_table(os.path.join(data_dir, 'skills.csv'))
+        synergies = _read_table(os.path.join(data_dir, 'synergies.csv'))
+
+        self.unit_by_id = {u['id']: u for u in units}
+        self.skill_by_id = {s['id']: s for s in skills}
+        self.unit_skill = {u['id']: u['skillId'] for u in units}
+        self.skills_by_effect = {}
+        for s in skills:
+            self.skills_by_effect.setdefault(s['effect'], []).append(s['id'])
+        # (group, id) -> [(threshold, bonus)] tăng dần
+        self.synergy_tiers = {}
+        for row in synergies:
+            bonus = json.loads(row['bonus']) if row['bonus'] else {}
+            self.synergy_tiers.setdefault((row['group'], row['id']), []).append((int(row['threshold']), bonus))
+        for tiers in self.synergy_tiers.values():
+            tiers.sort(key=lambda t: t[0])
+        self.load_ms = round((time.perf_counter() - t0) * 1000, 3)
+
+    @staticmethod
+    def stat_files(data_dir):
+        return tuple(os.stat(os.path.join(data_dir, f)).st_mtime_ns for f in FILES)
+
+    def synergy_at(self, group, sid, count):
+        """Mốc cao nhất có threshold <= count, hoặc None nếu chưa kích hoạt."""
+        active = None
+        for threshold, bonus in self.synergy_tiers.get((group, sid), ()):
+            if threshold > count:
+                break
+            active = {'group': group, 'id': sid, 'threshold': threshold, 'bonus': bonus}
+        return active
+
+
+class CatalogService:
+    """Catalog hiện tại + reload khi file đổi + LRU cache kết quả (đã encode JSON)."""
+
+    def __init__(self, data_dir=DATA_DIR, cache_size=CACHE_SIZE):
+        self.data_dir = data_dir
+        self.catalog = Catalog(data_dir)
+        self.reloads = 0
+        self._lock = threading.Lock()
+        self._next_check = time.monotonic() + RELOAD_CHECK_S
+        self._cached = lru_cache(maxsize=cache_size)(self._answer)
+
+    def maybe_reload(self):
+        now = time.monotonic()
+        if now < self._next_check:
+            return False
+        with self._lock:
+            if now < self._next_check:
+                return False
+            self._next_check = now + RELOAD_CHECK_S
+            try:
+                if Catalog.stat_files(self.data_dir) == self.catalog.mtimes:
+                    return False
+                fresh = Catalog(self.data_dir)
+            except Exception as e:
+                # file đang được ghi dở (hoặc hỏng kiểu gì cũng vậy): giữ catalog cũ, lần sau thử lại
+                print(f'⚠️ reload failed, keeping old catalog: {e}', file=sys.stderr)
+                return False
+            self.catalog = fresh
+            self.reloads += 1
+            self._cached.cache_clear()
+            return True
+
+    def answer(self, path, query):
+        """-> (status, body bytes). query là chuỗi query đã sort để làm key cache."""
+        cat = self.catalog
+        # key gồm cả catalog: request đang chạy dở lúc reload không ghi kết quả cũ vào cache
+        return self._cached(cat, path, query)
+
+    def _answer(self, cat, path, query):
+        q = {k: v[0] for k, v in parse_qs(query).items()}
+        parts = [unquote(p) for p in path.strip('/').split('/') if p]
+        result = None
+        if len(parts) == 2 and parts[0] == 'unit':
+            result = cat.unit_by_id.get(parts[1])
+        elif len(parts) == 2 and parts[0] == 'skill':
+            result = cat.skill_by_id.get(parts[1])
+        elif parts == ['skills'] and 'effect' in q:
+            result = [cat.skill_by_id[s] for s in cat.skills_by_effect.get(q['effect'], [])]
+        elif parts == ['synergy'] and {'group', 'id', 'count'} <= q.keys():
+            try:
+                count = int(q['count'])
+            except ValueError:
+                return 400, _encode({'error': 'count phải là số nguyên'})
+            result = cat.synergy_at(q['group'], q['id'], count)
+            if result is None and (q['group'], q['id']) in cat.synergy_tiers:
+                result = {'group': q['group'], 'id': q['id'], 'threshold': None, 'bonus': {}}
+        elif parts == ['unit-skills']:
+            result = cat.unit_skill if 'id' not in q else cat.unit_skill.get(q['id'])
+        else:
+            return 400, _encode({'error': f'unknown query: {path}'})
+        if result is None:
+            return 404, _encode({'error': 'not found'})
+        return 200, _encode(result)
+
+    def stats(self):
+        info = self._cached.cache_info()
+        cat = self.catalog
+        return {
+            'units': len(cat.unit_by_id), 'skills': len(cat.skill_by_id),
+            'synergies': len(cat.synergy_tiers), 'load_ms': cat.load_ms, 'reloads': self.reloads,
+            'cache': {'hits': info.hits, 'misses': info.misses, 'size': info.currsize, 'max': info.maxsize},
+        }
+
+
+def _encode(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive: client giữ kết nối cho nhiều query
+    service = None
+
+    def do_GET(self):
+        self.service.maybe_reload()
+        url = urlsplit(self.path)
+        if url.path.rstrip('/') == '/stats':
+            status, body = 200, _encode(self.service.stats())
+        else:
+            query = '&'.join(sorted(url.query.split('&'))) if url.query else ''
+            status, body = self.service.answer(url.path, query)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self):
+        # Unix socket không có (host, port)
+        return self.client_address[0] if self.client_address else 'unix'
+
+    def log_message(self, fmt, *args):
+        pass
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ('unix', 0)
+
+
+def make_server(service, host=HOST, port=PORT, unix_path=None):
+    # TCP: tắt Nagle, nếu không header + body ghi riêng sẽ dính delayed ACK (~40 ms/query)
+    handler = type('CatalogHandler', (Handler,), {'service': service, 'disable_nagle_algorithm': not unix_path})
+    if unix_path:
+        if os.path.exists(unix_path):
+            os.remove(unix_path)
+        return UnixHTTPServer(unix_path, handler)
+    return ThreadingHTTPServer((host, port), handler)
+
+
+# ── Client ──
+
+class _UnixConnection(http.client.HTTPConnection):
+    def __init__(self, path):
+        super().__init__('localhost')
+        self.unix_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.unix_path)
+
+
+class Client:
+    """Giữ một kết nối keep-alive tới daemon; query() trả về object đã decode."""
+
+    def __init__(self, host=HOST, port=PORT, unix_path=None):
+        self.conn = _UnixConnection(unix_path) if unix_path else http.client.HTTPConnection(host, port)
+
+    def query(self, path):
+        self.conn.request('GET', path)
+        resp = self.conn.getresponse()
+        body = json.loads(resp.read())
+        if resp.status != 200:
+            raise LookupError(f"{resp.status} {path}: {body.get('error')}")
+        return body
+
+    def close(self):
+        self.conn.close()
+
+
+def query(path, host=HOST, port=PORT, unix_path=None):
+    client = Client(host, port, unix_path)
+    try:
+        return client.query(path)
+    finally:
+        client.close()
+
+
+def _arg(argv, flag, default=None):
+    if flag in argv:
+        i = argv.index(flag)
+        return argv[i + 1]
+    return default
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    port = int(_arg(argv, '--port', PORT))
+    unix_path = _arg(argv, '--unix')
+    service = CatalogService(_arg(argv, '--data', DATA_DIR))
+    server = make_server(service, port=port, unix_path=unix_path)
+    where = unix_path or f'http://{HOST}:{port}'
+    print(f"✅ Catalog loaded in {service.catalog.load_ms} ms, serving on {where}")
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))  # để finally dọn socket file
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if unix_path and os.path.exists(unix_path):
+            os.remove(unix_path)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.exit(main())
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""
+Instrumentation cho các script dữ liệu (_build_skills, _analyze, _audit_skills).
+Đo wall time, CPU time, số dòng xử lý cho từng stage (load, parse, validate,
+write) rồi xuất report JSON.
+
+Opt-in: chạy script với `--profile report.json` hoặc đặt biến môi trường
+PIPELINE_PROFILE=report.json. Không bật thì stage() không đo gì cả.
+Pipeline generator nối nhau (đọc -> sort -> join -> ghi) thì bọc từng generator bằng
+prof.stream(name, items): thời gian của mỗi stage là thời gian riêng của nó, không
+tính phần đã tính cho stage con (bên trong) — tổng các stage = tổng thời gian chạy;
+mỗi dòng qua stream() tốn thêm ~1µs cho việc đo.
+Peak memory (tracemalloc) đo riêng bằng `--profile-memory` / PIPELINE_PROFILE_MEMORY=1:
+tracemalloc làm chậm code Python vài lần nên lần chạy đo memory không dùng để so thời gian.
+Khác thời gian, peak_bytes của một stage (kể cả stream) tính luôn stage con bên trong.
+"""
+import json, os, platform, sys, time, tracemalloc
+from contextlib import contextmanager
+
+ENV_VAR = 'PIPELINE_PROFILE'
+FLAG = '--profile'
+MEMORY_ENV_VAR = 'PIPELINE_PROFILE_MEMORY'
+MEMORY_FLAG = '--profile-memory'
+_END = object()
+
+
+class Stage:
+    """Số liệu của một stage; script gán `rows` bên trong khối with."""
+    __slots__ = ('name', 'rows', 'wall', 'cpu', 'peak')
+
+    def __init__(self, name):
+        self.name = name
+        self.rows = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.peak = None
+
+    def as_dict(self):
+        return {
+            'name': self.name,
+            'rows': self.rows,
+            'wall_s': round(self.wall, 6),
+            'cpu_s': round(self.cpu, 6),
+            'peak_bytes': self.peak,
+        }
+
+
+class Profiler:
+    def __init__(self, script, out_path=None, memory=False):
+        self.script = script
+        self.out_path = out_path
+        self.enabled = bool(out_path)
+        self.memory = self.enabled and memory
+        self.stages = []
+        self._own_tracing = False
+        # [wall, cpu] đã tính cho stage con của từng stage đang chạy
+        self._stack = []
+
+    @classmethod
+    def from_argv(cls, script, argv=None):
+        """Lấy đường dẫn report từ `--profile <file>` (bị gỡ khỏi argv) hoặc env."""
+        argv = sys.argv if argv is None else argv
+        out_path = os.environ.get(ENV_VAR) or None
+        memory = os.environ.get(MEMORY_ENV_VAR, '') not in ('', '0')
+        if MEMORY_FLAG in argv:
+            argv.remove(MEMORY_FLAG)
+            memory = True
+        if FLAG in argv:
+            i = argv.index(FLAG)
+            if i + 1 >= len(argv):
+                raise SystemExit(f'{FLAG} cần đường dẫn file JSON')
+            out_path = argv[i + 1]
+            del argv[i:i + 2]
+        return cls(script, out_path, memory)
+
+    @contextmanager
+    def stage(self, name):
+        st = Stage(name)
+        if not self.enabled:
+            yield st
+            return
+        base = self._memory_base()
+        w0, c0 = self._enter()
+        try:
+            yield st
+        finally:
+            self._exit(st, w0, c0, base)
+            self.stages.append(st)
+
+    def stream(self, name, items):
+        """Bọc một generator trong pipeline: đếm dòng và đo thời gian mỗi lần lấy item.
+        Không bật profile thì trả nguyên `items`, không tốn gì thêm."""
+        if not self.enabled:
+            return items
+        st = Stage(name)
+        self.stages.append(st)
+        if self.memory:
+            # peak so với lúc tạo stage: generator giữ dữ liệu giữa các lần lấy item
+            return self._timed_memory(st, iter(items), self._memory_base())
+        return self._timed(st, iter(items))
+
+    def _timed(self, st, it):
+        # _enter/_exit viết thẳng vào vòng lặp: chạy một lần cho mỗi dòng
+        stack, wall_clock, cpu_clock = self._stack, time.perf_counter, time.process_time
+        while True:
+            child = [0.0, 0.0, 0, 0]
+            stack.append(child)
+            w0, c0 = wall_clock(), cpu_clock()
+            try:
+                item = next(it, _END)
+            finally:
+                wall, cpu = wall_clock() - w0, cpu_clock() - c0
+                stack.pop()
+                st.wall += wall - child[0]
+                st.cpu += cpu - child[1]
+                if stack:
+                    stack[-1][0] += wall
+                    stack[-1][1] += cpu
+            if item is _END:
+                return
+            st.rows += 1
+            yield item
+
+    def _timed_memory(self, st, it, base):
+        while True:
+            w0, c0 = self._enter()
+            try:
+                item = next(it, _END)
+            finally:
+                self._exit(st, w0, c0, base)
+            if item is _END:
+                return
+            st.rows += 1
+            yield item
+
+    def _memory_base(self):
+        if not self.memory:
+            return None
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._own_tracing = True
+        return tracemalloc.get_traced_memory()[0]
+
+    # Mỗi frame trên _stack: [wall, cpu của stage con, peak của stage cha trước khi frame
+    # reset_peak, peak cao nhất của stage con]. tracemalloc chỉ có một peak toàn cục nên
+    # mỗi frame reset rồi trả lại peak cho frame cha khi thoát.
+
+    def _enter(self):
+        frame = [0.0, 0.0, 0, 0]
+        if self.memory:
+            frame[2] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.reset_peak()
+        self._stack.append(frame)
+        return time.perf_counter(), time.process_time()
+
+    def _exit(self, st, w0, c0, base=None):
+        wall, cpu = time.perf_counter() - w0, time.process_time() - c0
+        frame = self._stack.pop()
+        st.wall += wall - frame[0]
+        st.cpu += cpu - frame[1]
+        peak = 0
+        if self.memory:
+            peak = max(tracemalloc.get_traced_memory()[1], frame[3])
+            st.peak = max(st.peak or 0, peak - base)
+        if self._stack:
+            parent = self._stack[-1]
+            parent[0] += wall
+            parent[1] += cpu
+            parent[3] = max(parent[3], frame[2], peak)
+
+    def report(self):
+        stages = [s.as_dict() for s in self.stages]
+        return {
+            'script': self.script,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            # True: thời gian bị tracemalloc làm chậm, chỉ đọc peak_bytes
+            'memory_traced': self.memory,
+            'stages': stages,
+            # rows không cộng dồn: các stage xử lý cùng một tập dòng
+            'total': {
+                'wall_s': round(sum(s.wall for s in self.stages), 6),
+                'cpu_s': round(sum(s.cpu for s in self.stages), 6),
+                'peak_bytes': max((s.peak for s in self.stages if s.peak is not None), default=0) if self.memory else None,
+            },
+        }
+
+    def write(self):
+        """Ghi report JSON (nếu đã bật) và tắt tracemalloc nếu chính mình bật."""
+        if not self.enabled:
+            return None
+        if self._own_tracing:
+            tracemalloc.stop()
+            self._own_tracing = False
+        rep = self.report()
+        with open(self.out_path, 'w', encoding='utf-8') as f:
+            json.dump(rep, f, ensure_ascii=False, indent=2)
+        return rep
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+"""
+Log replay combat dạng binary, record cố định EVENT_DTYPE (18 byte/event):
+  fight u32 | turn u16 | actor u16 | target u16 | skill u16 | damage i32 | status u8 | flags u8
+actor/target/skill/status là mã số; bảng tra chuỗi nằm ở file kèm `<log>.json`
+(mã 0 = không có: đánh thường / không gây status / không có mục tiêu).
+
+Ghi: ReplayWriter gom event vào buffer NumPy rồi ghi cả khối bằng tofile().
+Đọc: open_log() map file bằng np.memmap, các hàm aggregate chạy theo chunk
+nên log hàng trăm triệu event cũng không phải nạp vào RAM hay thành object Python.
+
+Chạy: python _replay_log.py <log.bin> [--effect single_sleep --status sleep]
+"""
+import json, os, sys
+
+import numpy as np
+
+from _stream import iter_dicts
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SKILLS_PATH = os.path.join(HERE, 'data', 'skills.csv')
+
+MAGIC = b'FTRL'
+FORMAT_VERSION = 1
+HEADER_SIZE = 16
+EVENT_DTYPE = np.dtype([
+    ('fight', '<u4'), ('turn', '<u2'), ('actor', '<u2'), ('target', '<u2'),
+    ('skill', '<u2'), ('damage', '<i4'), ('status', 'u1'), ('flags', 'u1'),
+])
+HEADER_DTYPE = np.dtype([('magic', 'S4'), ('version', '<u2'), ('record_size', '<u2'), ('reserved', 'V8')])
+
+# flags
+DEATH = 1 << 0
+CRIT = 1 << 1
+MISS = 1 << 2
+
+BUFFER_EVENTS = 1 << 16
+CHUNK_EVENTS = 1 << 23
+# bảng mã -> mã lớn nhất vừa field trong EVENT_DTYPE
+TABLES = {'units': 0xFFFF, 'skills': 0xFFFF, 'statuses': 0xFF}
+
+
+def _sidecar(path):
+    return path + '.json'
+
+
+class _Interner:
+    """chuỗi <-> mã số nguyên; mã 0 dành cho 'không có'."""
+
+    def __init__(self, names=None, limit=0xFFFF):
+        self.limit = limit
+        self.names = list(names) if names else ['']
+        self.code = {n: i for i, n in enumerate(self.names)}
+
+    def __call__(self, name):
+        if not name:
+            return 0
+        c = self.code.get(name)
+        if c is None:
+            c = len(self.names)
+            if c > self.limit:
+                raise OverflowError(f'quá {self.limit} giá trị khác nhau trong một bảng')
+            self.code[name] = c
+            self.names.append(name)
+        return c
+
+
+class ReplayWriter:
+    """Append event vào log; mở lại file đã có thì ghi tiếp và giữ nguyên bảng mã.
+    Record cuối ghi dở (crash giữa chừng) bị cắt bỏ trước khi ghi tiếp."""
+
+    def __init__(self, path, buffer_events=BUFFER_EVENTS):
+        self.path = path
+        tables = {}
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        if exists:
+            _check_header(path)
+            torn = (os.path.getsize(path) - HEADER_SIZE) % EVENT_DTYPE.itemsize
+            if torn:
+                # append sau mẩu record dở sẽ làm lệch mọi event ghi sau nó
+                with open(path, 'r+b') as f:
+                    f.truncate(os.path.getsize(path) - torn)
+            with open(_sidecar(path), encoding='utf-8') as f:
+                tables = json.load(f)
+        self.tables = {t: _Interner(tables.get(t), limit) for t, limit in TABLES.items()}
+        self.f = open(path, 'ab')
+        if not exists:
+            header = np.zeros(1, HEADER_DTYPE)
+            header['magic'], header['version'], header['record_size'] = MAGIC, FORMAT_VERSION, EVENT_DTYPE.itemsize
+            header.tofile(self.f)
+        self.buf = np.zeros(buffer_events, EVENT_DTYPE)
+        self.n = 0
+        self.written = 0
+
+    def event(self, fight, turn, actor, target=None, skill=None, damage=0,
+              status=None, death=False, crit=False, miss=False):
+        if self.n == len(self.buf):
+            self.flush()
+        t = self.tables
+        self.buf[self.n] = (fight, turn, t['units'](actor), t['units'](target), t['skills'](skill), damage,
+                            t['statuses'](status), (DEATH if death else 0) | (CRIT if crit else 0) | (MISS if miss else 0))
+        self.n += 1
+
+    def extend(self, events):
+        """Ghi thẳng một mảng EVENT_DTYPE đã mã hóa sẵn (mã phải lấy từ self.code())."""
+        self.flush()
+        np.asarray(events, EVENT_DTYPE).tofile(self.f)
+        self.written += len(events)
+
+    def code(self, table, name):
+        return self.tables[table](name)
+
+    def flush(self):
+        # bảng mã ghi trước record (thay file nguyên khối): crash giữa hai bước thì
+        # bảng chỉ thừa tên chưa dùng, không bao giờ thiếu mã mà record đã tham chiếu
+        sidecar = _sidecar(self.path)
+        with open(sidecar + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump({t: i.names for t, i in self.tables.items()}, f, ensure_ascii=False)
+        os.replace(sidecar + '.tmp', sidecar)
+        if self.n:
+            self.buf[:self.n].tofile(self.f)
+            self.written += self.n
+            self.n = 0
+        self.f.flush()
+
+    def close(self):
+        self.flush()
+        self.f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _check_header(path):
+    header = np.fromfile(path, HEADER_DTYPE, count=1)
+    if len(header) != 1 or header['magic'][0] != MAGIC:
+        raise ValueError(f'{path}: không phải replay log')
+    if header['version'][0] != FORMAT_VERSION or header['record_size'][0] != EVENT_DTYPE.itemsize:
+        raise ValueError(f"{path}: format v{header['version'][0]} / {header['record_size'][0]} byte không hỗ trợ")
+
+
+class ReplayLog:
+    """events: np.memmap read-only; tables: {'units'|'skills'|'statuses': [tên theo mã]}."""
+
+    def __init__(self, path):
+        _check_header(path)
+        self.path = path
+        n = (os.path.getsize(path) - HEADER_SIZE) // EVENT_DTYPE.itemsize
+        self.events = (np.memmap(path, EVENT_DTYPE, mode='r', offset=HEADER_SIZE, shape=(n,))
+                       if n else np.zeros(0, EVENT_DTYPE))
+        with open(_sidecar(path), encoding='utf-8') as f:
+            self.tables = json.load(f)
+        self.codes = {t: {name: i for i, name in enumerate(names)} for t, names in self.tables.items()}
+
+    def __len__(self):
+        return len(self.events)
+
+    def chunks(self, size=CHUNK_EVENTS):
+        for i in range(0, len(self.events), size):
+            yield self.events[i:i + size]
+
+    def code(self, table, name):
+        return self.codes[table].get(name, -1)
+
+    # ── aggregate ──
+
+    def _bincount(self, field, table, weights=None, where=None):
+        n = len(self.tables[table])
+        out = np.zeros(n, dtype=np.float64 if weights else np.int64)
+        for ch in self.chunks():
+            sel = ch if where is None else ch[where(ch)]
+            w = sel[weights].astype(np.float64) if weights else None
+            counts = np.bincount(sel[field], weights=w, minlength=n)
+            if len(counts) > n:
+                raise ValueError(f'{self.path}: mã {field} {len(counts) - 1} vượt bảng {table} ({n} tên)')
+            out += counts
+        return out
+
+    def damage_by_skill(self):
+        return self._bincount('skill', 'skills', weights='damage')
+
+    def uses_by_skill(self):
+        return self._bincount('skill', 'skills')
+
+    def deaths_by_unit(self):
+        """Số lần chết theo unit bị hạ (target của event có cờ DEATH)."""
+        return self._bincount('target', 'units', where=lambda ch: (ch['flags'] & DEATH) != 0)
+
+    def kills_by_unit(self):
+        return self._bincount('actor', 'units', where=lambda ch: (ch['flags'] & DEATH) != 0)
+
+    def status_landing(self, skill_names, status):
+        """(số event của các skill, số event có status đó) — tỉ lệ trúng = landed / total."""
+        codes = np.array([c for c in (self.code('skills', s) for s in skill_names) if c > 0], dtype=np.uint16)
+        st = self.code('statuses', status)
+        total = landed = 0
+        if not len(codes):
+            return 0, 0
+        for ch in self.chunks():
+            mask = np.isin(ch['skill'], codes)
+            total += int(mask.sum())
+            if st > 0:
+                landed += int((mask & (ch['status'] == st)).sum())
+        return total, landed
+
+    def fights(self):
+        count = 0
+        last = None
+        for ch in self.chunks():
+            f = ch['fight']
+            if not len(f):
+                continue
+            count += int((f[1:] != f[:-1]).sum()) + int(last is None or f[0] != last)
+            last = f[-1]
+        return count
+
+
+def open_log(path):
+    return ReplayLog(path)
+
+
+def skills_with_effect(effect, path=SKILLS_PATH):
+    return [r['id'] for r in iter_dicts(path) if r['effect'] == effect]
+
+
+def _arg(argv, flag, default=None):
+    if flag in argv:
+        i = argv.index(flag)
+        return argv[i + 1]
+    return default
+
+
+def _top(values, names, k=10):
+    idx = np.argsort(-values)[:k]
+    return [(names[i], values[i]) for i in idx if values[i] and names[i]]
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0].startswith('--'):
+        print(__doc__)
+        return 2
+    log = open_log(argv[0])
+    names = log.tables
+    print(f'✅ {len(log):,} events, {log.fights():,} fights, {len(names["units"]) - 1} units, '
+          f'{len(names["skills"]) - 1} skills')
+    print('\n=== damage theo skill ===')
+    for name, v in _top(log.damage_by_skill(), names['skills']):
+        print(f'  {name:35s} {v:>14,.0f}')
+    print('\n=== số lần chết theo unit ===')
+    for name, v in _top(log.deaths_by_unit(), names['units']):
+        print(f'  {name:35s} {v:>10,d}')
+
+    effect, status = _arg(argv, '--effect'), _arg(argv, '--status')
+    if effect and status:
+        skills = skills_with_effect(effect)
+        total, landed = log.status_landing(skills, status)
+        rate = f'{landed / total:.1%}' if total else 'n/a'
+        print(f'\n{effect} ({", ".join(skills) or "không có skill"}): {status} trúng {landed:,}/{total:,} = {rate}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.exit(main())
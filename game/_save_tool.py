@@ -0,0 +1,409 @@
+# -*- coding: utf-8 -*-
+"""
+Phân tích / migrate hàng loạt save export từ persistence.js (saveProgress).
+Mỗi file là một blob {version, savedAt, payload} dạng JSON thường hoặc flatted.
+Áp dụng đúng migrateSaveData / migrateLegacyStatuses của persistence.js rồi
+gom thống kê round, level, gold, đội hình trên board. Chia việc cho process pool,
+đọc thư mục kiểu streaming và chỉ giữ số liệu gộp, không giữ từng save.
+
+Chạy: python _save_tool.py <thư mục save> [--migrate OUT_DIR] [--workers N]
+                           [--json report.json] [--profile report.json]
+"""
+import json, math, os, sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from _instrument import Profiler
+from _stream import iter_dicts
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+UNITS_PATH = os.path.join(HERE, 'data', 'units.csv')
+FLATTED_DIR = os.path.join(HERE, 'node_modules', 'flatted', 'python')
+CURRENT_VERSION = 2
+LEVEL_CAP = 25
+UNIT_REPLACEMENT_MAP = {}  # giống UNIT_REPLACEMENT_MAP trong persistence.js
+SAVE_EXTS = ('.json', '.txt', '.save')
+MIGRATION_DONE = 'Migration to version 2 complete'
+
+_catalog = None  # id -> (classType, tribe), nạp một lần mỗi process
+_flatted = None
+
+
+def load_catalog(path=UNITS_PATH):
+    return {r['id']: (r['classType'], r['tribe']) for r in iter_dicts(path)}
+
+
+def _init_worker(units_path):
+    global _catalog
+    _catalog = load_catalog(units_path)
+
+
+def _get_flatted():
+    global _flatted
+    if _flatted is None:
+        if FLATTED_DIR not in sys.path:
+            sys.path.insert(0, FLATTED_DIR)
+        import flatted
+        _flatted = flatted
+    return _flatted
+
+
+# ── Port của persistence.js ──
+
+def migrate_legacy_statuses(unit):
+    """slowTurns -> evadeDebuff 15%, hasteTurns -> evadeBuff 10% (Requirement 7.1)"""
+    if not unit or not isinstance(unit.get('statuses'), dict):
+        return False
+    statuses = unit['statuses']
+    migrated = False
+    if 'slowTurns' in statuses:
+        if _num(statuses['slowTurns']) > 0:
+            statuses['evadeDebuffTurns'] = statuses['slowTurns']
+            statuses['evadeDebuffValue'] = 0.15
+            migrated = True
+        del statuses['slowTurns']
+    if 'hasteTurns' in statuses:
+        if _num(statuses['hasteTurns']) > 0:
+            statuses['evadeBuffTurns'] = statuses['hasteTurns']
+            statuses['evadeBuffValue'] = 0.10
+            migrated = True
+        del statuses['hasteTurns']
+    return migrated
+
+
+def _nz(v, default):
+    """`v ?? default` của JS"""
+    return default if v is None else v
+
+
+def _num(v):
+    """ToNumber của JS cho giá trị JSON, dùng khi so sánh / Math.min/max:
+    "1" -> 1, "" / null / false -> 0, true -> 1, chuỗi không phải số -> NaN."""
+    if v is None:
+        return 0
+    if isinstance(v, bool):
+        return int(v)
+    if isinstance(v, (int, float)):
+        return v
+    if isinstance(v, str):
+        text = v.strip()
+        if not text:
+            return 0
+        try:
+            x = float(text)
+        except ValueError:
+            return math.nan
+        return int(x) if x.is_integer() else x
+    return math.nan  # object / array (JS đổi [] -> 0, [x] -> x; save thật không có)
+
+
+def _clamp(v, lo, hi=None):
+    """Math.max(lo, Math.min(hi, v)); NaN -> None như JSON.stringify khi game lưu lại."""
+    x = _num(v)
+    if x != x:
+        return None
+    return max(lo, x if hi is None else min(hi, x))
+
+
+def _replace(base_id, unit_ids):
+    replacement = UNIT_REPLACEMENT_MAP.get(base_id)
+    return replacement if replacement and replacement in unit_ids else None
+
+
+def migrate_save_data(data, unit_ids):
+    """Trả về (data hoặc None, migration_log) — cùng luật với migrateSaveData."""
+    log = []
+    try:
+        # mảng cũng là object trong JS: qua được bước kiểm tra đầu, lỗi ở bước sau
+        if not isinstance(data, (dict, list)):
+            log.append('ERROR: Save data is corrupted or invalid')
+            return None, log
+        data_obj = data if isinstance(data, dict) else {}
+        version = _nz(data_obj.get('version'), 1)
+        payload = data_obj.get('payload')
+        if not isinstance(payload, (dict, list)):
+            log.append('ERROR: Save payload is corrupted')
+            return None, log
+        payload = payload if isinstance(payload, dict) else {}
+        player = payload.get('player')
+        if not isinstance(player, dict):
+            log.append('ERROR: Player data is corrupted')
+            return None, log
+
+        if _num(version) < 2:
+            log.append('Migrating save data from version 1 to version 2')
+            old_level = _nz(player.get('level'), 1)
+            if _num(old_level) > 9:
+                log.append(f'WARNING: Level {old_level} exceeds old cap of 9, clamping to {LEVEL_CAP}')
+            player['level'] = _clamp(old_level, 1, LEVEL_CAP)
+
+            board = player.get('board')
+            if isinstance(board, list):
+                for r, row in enumerate(board):
+                    if not isinstance(row, list):
+                        continue
+                    for c, unit in enumerate(row):
+                        if not isinstance(unit, dict) or not unit.get('baseId'):
+                            continue
+                        if migrate_legacy_statuses(unit):
+                            log.append(f"Migrated legacy speed statuses for unit {unit['baseId']} at board[{r}][{c}]")
+                        if unit['baseId'] not in unit_ids:
+                            replacement = _replace(unit['baseId'], unit_ids)
+                            if replacement:
+                                log.append(f"Replaced removed unit {unit['baseId']} with {replacement} at board[{r}][{c}]")
+                                unit['baseId'] = replacement
+                            else:
+                                log.append(f"Removed invalid unit {unit['baseId']} from board[{r}][{c}]")
+                                row[c] = None
+
+            bench = player.get('bench')
+            if isinstance(bench, list):
+                kept = []
+                for idx, unit in enumerate(bench):
+                    if not isinstance(unit, dict) or not unit.get('baseId'):
+                        continue
+                    if migrate_legacy_statuses(unit):
+                        log.append(f"Migrated legacy speed statuses for unit {unit['baseId']} on bench[{idx}]")
+                    if unit['baseId'] not in unit_ids:
+                        replacement = _replace(unit['baseId'], unit_ids)
+                        if not replacement:
+                            log.append(f"Removed invalid unit {unit['baseId']} from bench[{idx}]")
+                            continue
+                        log.append(f"Replaced removed unit {unit['baseId']} with {replacement} on bench[{idx}]")
+                        unit['baseId'] = replacement
+                    kept.append(unit)
+                player['bench'] = kept
+
+            shop = player.get('shop')
+            if isinstance(shop, list):
+                offers = []
+                for idx, offer in enumerate(shop):
+                    if not isinstance(offer, dict) or not offer.get('baseId'):
+                        offers.append(None)
+                    elif offer['baseId'] in unit_ids:
+                        offers.append(offer)
+                    else:
+                        replacement = _replace(offer['baseId'], unit_ids)
+                        if replacement:
+                            log.append(f"Replaced removed unit {offer['baseId']} with {replacement} in shop[{idx}]")
+                            offers.append({**offer, 'baseId': replacement})
+                        else:
+                            log.append(f"Removed invalid unit {offer['baseId']} from shop[{idx}]")
+                            offers.append(None)
+                player['shop'] = offers
+
+            data['version'] = CURRENT_VERSION
+            log.append(MIGRATION_DONE)
+
+        player['level'] = _clamp(_nz(player.get('level'), 1), 1, LEVEL_CAP)
+        player['round'] = _clamp(_nz(player.get('round'), 1), 1)
+        player['hp'] = _clamp(_nz(player.get('hp'), 3), 0)
+        player['gold'] = _clamp(_nz(player.get('gold'), 0), 0)
+
+        deploy_cap_bonus = _nz(player.get('deployCapBonus'), 0)
+        if _num(deploy_cap_bonus) < 0 or _num(deploy_cap_bonus) > 100:
+            log.append(f'WARNING: Invalid deployCapBonus {deploy_cap_bonus}, resetting to 0')
+            player['deployCapBonus'] = 0
+
+        return data, log
+    except Exception as e:  # giống catch trong migrateSaveData
+        log.append(f'ERROR: Migration failed - {e}')
+        return None, log
+
+
+# ── Đọc / ghi blob ──
+
+def decode_blob(raw):
+    """-> (data, 'json' | 'flatted'). Blob bị stringify hai lần cũng được."""
+    obj = json.loads(raw)
+    if isinstance(obj, str):
+        return decode_blob(obj)
+    if isinstance(obj, list):
+        return _get_flatted().parse(raw), 'flatted'
+    return obj, 'json'
+
+
+def encode_blob(data, fmt):
+    if fmt == 'flatted':
+        return _get_flatted().stringify(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+
+def board_units(player):
+    board = player.get('board')
+    if not isinstance(board, list):
+        return []
+    return [u for row in board if isinstance(row, list) for u in row if isinstance(u, dict) and u.get('baseId')]
+
+
+def _version_key(v):
+    """data.version ?? 1 ở dạng hashable để Summary (process cha) đếm được: [2] -> '[2]'."""
+    v = _nz(v, 1)
+    return v if isinstance(v, (int, str)) or (isinstance(v, float) and v == v) else json.dumps(v)
+
+
+def process_file(path, out_dir=None):
+    """Worker: đọc, migrate, (ghi) và trả về số liệu gọn của một save.
+    Mọi lỗi của một file (kể cả blob flatted hỏng) chỉ làm hỏng file đó, không làm chết cả batch."""
+    try:
+        return _process(path, out_dir)
+    except Exception as e:
+        return {'ok': False, 'kind': type(e).__name__, 'error': f'{type(e).__name__}: {e}'}
+
+
+def _process(path, out_dir):
+    with open(path, encoding='utf-8') as f:
+        data, fmt = decode_blob(f.read())
+
+    version = _version_key(data.get('version')) if isinstance(data, dict) else None
+    data, log = migrate_save_data(data, _catalog)
+    if data is None:
+        error = log[-1] if log else 'migration failed'
+        return {'ok': False, 'kind': error, 'error': error}
+
+    player = data['payload']['player']
+    units = board_units(player)
+    if out_dir is not None:
+        with open(os.path.join(out_dir, os.path.basename(path)), 'w', encoding='utf-8') as f:
+            f.write(encode_blob(data, fmt))
+    return {
+        'ok': True,
+        'format': fmt,
+        'version': version,
+        'migrated': MIGRATION_DONE in log,
+        'round': player['round'],
+        'level': player['level'],
+        'gold': player['gold'],
+        'units': [u['baseId'] for u in units],
+        'classes': [_catalog[u['baseId']][0] for u in units if u['baseId'] in _catalog],
+        'tribes': [_catalog[u['baseId']][1] for u in units if u['baseId'] in _catalog],
+    }
+
+
+class Summary:
+    """Gộp số liệu từng save mà không giữ lại các save."""
+
+    def __init__(self):
+        self.files = self.failed = self.migrated = 0
+        self.formats, self.versions, self.errors = Counter(), Counter(), Counter()
+        self.rounds, self.levels, self.gold = Counter(), Counter(), Counter()
+        self.units, self.classes, self.tribes, self.board_size = Counter(), Counter(), Counter(), Counter()
+
+    def add(self, r):
+        self.files += 1
+        if not r['ok']:
+            self.failed += 1
+            self.errors[r['kind']] += 1
+            return
+        self.migrated += r['migrated']
+        self.formats[r['format']] += 1
+        self.versions[r['version']] += 1
+        self.rounds[r['round']] += 1
+        self.levels[r['level']] += 1
+        self.gold[r['gold']] += 1
+        self.board_size[len(r['units'])] += 1
+        self.units.update(r['units'])
+        self.classes.update(r['classes'])
+        self.tribes.update(r['tribes'])
+
+    @staticmethod
+    def _stats(hist):
+        values = sorted(v for v in hist if v is not None)  # None: giá trị NaN trong save
+        n = sum(hist[v] for v in values)
+        if not n:
+            return {}
+        out = {'min': values[0], 'max': values[-1], 'mean': round(sum(v * hist[v] for v in values) / n, 3)}
+        for q in (50, 90):
+            target = n * q / 100
+            acc = 0
+            for v in values:
+                acc += hist[v]
+                if acc >= target:
+                    out[f'p{q}'] = v
+                    break
+        return out
+
+    def as_dict(self):
+        return {
+            'files': self.files, 'failed': self.failed, 'migrated': self.migrated,
+            'formats': dict(self.formats), 'versions': {str(k): v for k, v in self.versions.items()},
+            'errors': dict(self.errors),
+            'round': self._stats(self.rounds), 'level': self._stats(self.levels),
+            'gold': self._stats(self.gold), 'board_size': self._stats(self.board_size),
+            'top_units': self.units.most_common(10),
+            'classes': dict(self.classes.most_common()), 'tribes': dict(self.tribes.most_common()),
+        }
+
+
+def iter_save_files(folder):
+    with os.scandir(folder) as it:
+        for entry in it:
+            if entry.is_file() and entry.name.endswith(SAVE_EXTS):
+                yield entry.path
+
+
+def run(folder, out_dir=None, workers=None, units_path=UNITS_PATH, chunksize=64):
+    """Chạy process_file trên process pool; map theo chunk, kết quả gộp dần vào Summary."""
+    if out_dir is not None:
+        os.makedirs(out_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    summary = Summary()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(units_path,)) as pool:
+        files = iter_save_files(folder)
+        while True:
+            # giới hạn số file đang xử lý để thư mục lớn cỡ nào RAM cũng không tăng
+            batch = [p for _, p in zip(range(chunksize * workers * 4), files)]
+            if not batch:
+                break
+            for r in pool.map(process_file, batch, [out_dir] * len(batch), chunksize=chunksize):
+                summary.add(r)
+    return summary
+
+
+def _arg(argv, flag, default=None):
+    if flag in argv:
+        i = argv.index(flag)
+        return argv[i + 1]
+    return default
+
+
+def main(argv=None, prof=None):
+    argv = sys.argv[1:] if argv is None else argv
+    prof = prof or Profiler(None)
+    if not argv or argv[0].startswith('--'):
+        print(__doc__)
+        return 2
+    folder = argv[0]
+    out_dir = _arg(argv, '--migrate')
+    workers = _arg(argv, '--workers')
+    json_path = _arg(argv, '--json')
+
+    with prof.stage('parse') as st:
+        summary = run(folder, out_dir, int(workers) if workers else None)
+        st.rows = summary.files
+
+    rep = summary.as_dict()
+    print(f"✅ {rep['files']} saves, {rep['failed']} lỗi, {rep['migrated']} đã migrate")
+    for key in ('round', 'level', 'gold', 'board_size'):
+        print(f'  {key:10s} {rep[key]}')
+    print(f"  classes    {rep['classes']}")
+    print(f"  tribes     {rep['tribes']}")
+    print(f"  top units  {rep['top_units']}")
+    if rep['errors']:
+        print(f"❌ errors    {rep['errors']}")
+    if out_dir:
+        print(f'✅ Migrated saves written to {out_dir}')
+    if json_path:
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(rep, f, ensure_ascii=False, indent=2)
+        print(f'📊 Report written to {json_path}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.stdout.reconfigure(encoding='utf-8')
+    prof = Profiler.from_argv('save_tool')
+    code = main(prof=prof)
+    if prof.write():
+        print(f'📊 Profile written to {prof.out_path}')
+    sys.exit(code)
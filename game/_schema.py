@@ -0,0 +1,367 @@
+# -*- coding: utf-8 -*-
+"""
+Schema cho skills.csv (mọi cột trong COLS), units.csv và synergies.csv.
+Spec khai báo dạng tuple, compile một lần thành checker theo từng cột rồi
+validate cả cột một lượt. Tham chiếu chéo kiểm tra bằng set (hash join):
+  units.skillId -> skills.id, synergies CLASS/TRIBE/UNIT -> giá trị trong units.csv
+Chạy: python _schema.py [--profile report.json]
+"""
+import csv, json, math, os, re, sys
+from collections import Counter, namedtuple
+
+from _instrument import Profiler
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(HERE, 'data')
+
+Issue = namedtuple('Issue', 'table line col value msg')
+
+ACTION_PATTERNS = {'SELF', 'MELEE_FRONT', 'RANGED_STATIC', 'ASSASSIN_BACK'}
+DAMAGE_TYPES = {'physical', 'magic', 'true'}
+STATS = {'hp', 'atk', 'def', 'matk', 'mdef'}
+CLASSES = {'TANKER', 'FIGHTER', 'MAGE', 'ARCHER', 'ASSASSIN', 'SUPPORT'}
+TRIBES = {'STONE', 'WIND', 'FIRE', 'TIDE', 'WOOD', 'SWARM', 'SPIRIT', 'NIGHT'}
+SYNERGY_GROUPS = {'CLASS', 'TRIBE', 'UNIT'}
+
+# spec: col -> (required, kind, *args)
+SLUG = ('slug',)
+TEXT = ('text',)
+PROB = ('float', 0, 1)
+AMOUNT = ('float', 0, None)
+COUNT = ('int', 0, None)
+TURNS = ('int', 1, 10)
+TARGETS = ('int', 1, 20)
+
+SKILL_SPEC = {
+    'id': (True,) + SLUG,
+    'name': (True,) + TEXT,
+    'descriptionVi': (True,) + TEXT,
+    'actionPattern': (True, 'enum', ACTION_PATTERNS),
+    'effect': (True,) + SLUG,
+    'damageType': (False, 'enum', DAMAGE_TYPES),
+    'base': (False,) + AMOUNT,
+    'scaleStat': (False, 'enum', STATS),
+    'scale': (False,) + AMOUNT,
+    'shieldBase': (False,) + AMOUNT,
+    'tauntTurns': (False,) + TURNS,
+    'stunChance': (False,) + PROB,
+    'stunTurns': (False,) + TURNS,
+    'reflectPct': (False,) + PROB,
+    'reflectTurns': (False,) + TURNS,
+    'armorBuff': (False,) + AMOUNT,
+    'mdefBuff': (False,) + AMOUNT,
+    'turns': (False,) + TURNS,
+    'hit1': (False, 'json_hit'),  # jsonFields trong src/data/skills.js
+    'hit2': (False, 'json_hit'),
+    'lifesteal': (False,) + PROB,
+    'echoBase': (False,) + AMOUNT,
+    'echoScale': (False,) + AMOUNT,
+    'maxHits': (False,) + TARGETS,
+    'sleepChance': (False,) + PROB,
+    'sleepTurns': (False,) + TURNS,
+    'armorBreak': (False,) + AMOUNT,
+    'freezeChance': (False,) + PROB,
+    'freezeTurns': (False,) + TURNS,
+    'splashCount': (False,) + TARGETS,
+    'poisonTurns': (False,) + TURNS,
+    'poisonPerTurn': (False,) + AMOUNT,
+    'shieldScaleStat': (False, 'enum', STATS),
+    'shieldScale': (False,) + AMOUNT,
+    'rageGain': (False,) + COUNT,
+    'maxTargets': (False,) + TARGETS,
+    'selfAtkBuff': (False,) + AMOUNT,
+    'assistRate': (False,) + PROB,
+    'evadeBuff': (False,) + PROB,
+    'atkBuff': (False,) + AMOUNT,
+    'buffStats': (False, 'json_stats'),
+    'armorPen': (False,) + PROB,
+    'killRage': (False,) + PROB,
+    'diseaseTurns': (False,) + TURNS,
+    'diseaseDamage': (False,) + AMOUNT,
+}
+
+UNIT_SPEC = {
+    'id': (True,) + SLUG,
+    'name': (True,) + TEXT,
+    'species': (True,) + TEXT,
+    'icon': (True,) + TEXT,
+    'tribe': (True, 'enum', TRIBES),
+    'tribeVi': (True,) + TEXT,
+    'classType': (True, 'enum', CLASSES),
+    'classVi': (True,) + TEXT,
+    'tier': (True, 'int', 1, 5),
+    'hp': (True, 'int', 1, None),
+    'atk': (True,) + COUNT,
+    'def': (True,) + COUNT,
+    'matk': (True,) + COUNT,
+    'mdef': (True,) + COUNT,
+    'range': (True, 'int', 1, 10),
+    'rageMax': (True, 'int', 1, 10),
+    'skillId': (True,) + SLUG,
+    'star1Desc': (False,) + TEXT,
+    'star2Desc': (False,) + TEXT,
+    'star3Desc': (False,) + TEXT,
+}
+
+SYNERGY_SPEC = {
+    'group': (True, 'enum', SYNERGY_GROUPS),
+    'id': (True,) + TEXT,
+    'name': (False,) + TEXT,
+    'threshold': (True, 'int', 1, 10),
+    'bonus': (True, 'json_stats'),
+}
+
+
+# ── Checker factories: trả về fn(value) -> None nếu hợp lệ, hoặc message lỗi ──
+
+_SLUG_RE = re.compile(r'^[a-z0-9_]+$')
+
+
+def _slug():
+    match = _SLUG_RE.match
+    return lambda v: None if match(v) else 'id phải là [a-z0-9_]'
+
+
+def _text():
+    return lambda v: None
+
+
+def _enum(values):
+    allowed = frozenset(values)
+    label = '|'.join(sorted(allowed))
+    return lambda v: None if v in allowed else f'không thuộc {label}'
+
+
+def _number(cast, lo, hi):
+    name = cast.__name__
+    def check(v):
+        try:
+            x = cast(v)
+        except ValueError:
+            return f'không phải {name}'
+        # game đọc bằng Number(): 'inf' / '1_000' thành NaN và bị bỏ qua không báo
+        if not math.isfinite(x) or '_' in v:
+            return f'không phải {name} hữu hạn'
+        if (lo is not None and x < lo) or (hi is not None and x > hi):
+            return f'ngoài khoảng [{lo}, {hi}]'
+        return None
+    return check
+
+
+def _int(lo, hi):
+    return _number(int, lo, hi)
+
+
+def _float(lo, hi):
+    return _number(float, lo, hi)
+
+
+def _reject_constant(name):
+    raise ValueError(f'{name} không hợp lệ trong JSON')  # JSON.parse không nhận NaN / Infinity
+
+
+def _load_json_object(v):
+    """-> (object, None) hoặc (None, message lỗi); giống JSON.parse của game."""
+    try:
+        obj = json.loads(v, parse_constant=_reject_constant)
+    except ValueError:
+        return None, 'JSON không hợp lệ'
+    if not isinstance(obj, dict):
+        return None, 'JSON phải là object'
+    return obj, None
+
+
+def _is_number(x):
+    return isinstance(x, (int, float)) and not isinstance(x, bool) and math.isfinite(x)
+
+
+def _json_stats():
+    def check(v):
+        obj, msg = _load_json_object(v)
+        if msg:
+            return msg
+        if not all(_is_number(x) for x in obj.values()):
+            return 'giá trị JSON phải là số hữu hạn'
+        return None
+    return check
+
+
+def _json_hit():
+    """{base, scaleStat, scale} cho hit1/hit2 (calcSkillRaw trong CombatScene.js)."""
+    def check(v):
+        obj, msg = _load_json_object(v)
+        if msg:
+            return msg
+        extra = obj.keys() - {'base', 'scaleStat', 'scale'}
+        if extra:
+            return f"key không hỗ trợ: {', '.join(sorted(extra))}"
+        if 'base' not in obj and 'scale' not in obj:
+            return 'cần base hoặc scale'
+        if not all(_is_number(obj[k]) and obj[k] >= 0 for k in ('base', 'scale') if k in obj):
+            return 'base/scale phải là số hữu hạn >= 0'
+        if 'scaleStat' in obj and obj['scaleStat'] not in STATS:
+            return f"scaleStat không thuộc {'|'.join(sorted(STATS))}"
+        return None
+    return check
+
+
+FACTORIES = {
+    'slug': _slug, 'text': _text, 'enum': _enum,
+    'int': _int, 'float': _float, 'json_stats': _json_stats, 'json_hit': _json_hit,
+}
+
+
+def compile_schema(spec):
+    """col -> (required, checker); gọi một lần rồi dùng lại cho mọi batch."""
+    return {col: (required, FACTORIES[kind](*args)) for col, (required, kind, *args) in spec.items()}
+
+
+SKILL_SCHEMA = compile_schema(SKILL_SPEC)
+UNIT_SCHEMA = compile_schema(UNIT_SPEC)
+SYNERGY_SCHEMA = compile_schema(SYNERGY_SPEC)
+
+
+def _line(i):
+    return i + 2  # dòng 1 là header
+
+
+def check_column(table, col, values, required, check):
+    """Validate cả cột một lượt; ô trống chỉ lỗi khi cột bắt buộc."""
+    issues = []
+    for i, v in enumerate(values):
+        if v == '':
+            if required:
+                issues.append(Issue(table, _line(i), col, v, 'bắt buộc'))
+            continue
+        msg = check(v)
+        if msg:
+            issues.append(Issue(table, _line(i), col, v, msg))
+    return issues
+
+
+def validate_table(table, columns, schema):
+    """columns: {col: list giá trị}. Thiếu / thừa cột so với schema cũng là lỗi."""
+    issues = []
+    for col in schema.keys() - columns.keys():
+        issues.append(Issue(table, 1, col, '', 'thiếu cột'))
+    for col in columns.keys() - schema.keys():
+        issues.append(Issue(table, 1, col, '', 'cột không có trong schema'))
+    for col, values in columns.items():
+        if col in schema:
+            required, check = schema[col]
+            issues.extend(check_column(table, col, values, required, check))
+    return issues
+
+
+def check_unique(table, col, values):
+    dupes = {v for v, n in Counter(values).items() if n > 1}
+    return [Issue(table, _line(i), col, v, 'trùng id') for i, v in enumerate(values) if v in dupes]
+
+
+def check_refs(table, col, values, targets, target_label):
+    """Hash join: chỉ dò lại vị trí cho những giá trị không có trong targets."""
+    missing = set(values) - targets
+    if not missing:
+        return []
+    return [Issue(table, _line(i), col, v, f'không có trong {target_label}')
+            for i, v in enumerate(values) if v in missing]
+
+
+def check_widths(table, header, rows):
+    """Dòng có số ô khác header (vd. dấu phẩy không quote trong mô tả) — kiểm tra trước
+    khi chuyển sang cột, vì khi đó ô thừa bị cắt và giá trị đã lệch cột."""
+    width = len(header)
+    return [Issue(table, _line(i), '*', r[0] if r else '', f'{len(r)} ô, header có {width}')
+            for i, r in enumerate(rows) if len(r) != width]
+
+
+def columns_of(header, rows):
+    """Chuyển dòng list sang dạng cột; dòng thiếu ô được coi là ô trống, ô thừa bị bỏ
+    (check_widths báo lỗi các dòng này)."""
+    width = len(header)
+    padded = (r if len(r) >= width else r + [''] * (width - len(r)) for r in rows)
+    cols = list(zip(*padded)) or [()] * width
+    return {h: list(c) for h, c in zip(header, cols)}
+
+
+def columns_of_dicts(rows, cols):
+    return {c: [r.get(c, '') for r in rows] for c in cols}
+
+
+def read_table(path, table):
+    """-> (columns, issues về số ô của từng dòng)."""
+    with open(path, encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        rows = list(reader)
+    return columns_of(header, rows), check_widths(table, header, rows)
+
+
+def read_columns(path):
+    """Như read_table nhưng raise ValueError nếu có dòng sai số ô."""
+    columns, issues = read_table(path, os.path.basename(path))
+    if issues:
+        raise ValueError('\n'.join(format_issue(x) for x in issues))
+    return columns
+
+
+def validate_skills(columns):
+    return (validate_table('skills', columns, SKILL_SCHEMA)
+            + check_unique('skills', 'id', columns.get('id', [])))
+
+
+def validate_catalog(skills, units, synergies):
+    """skills/units/synergies: {col: list giá trị} -> list Issue."""
+    issues = validate_skills(skills)
+    issues += validate_table('units', units, UNIT_SCHEMA)
+    issues += check_unique('units', 'id', units.get('id', []))
+    issues += check_refs('units', 'skillId', units.get('skillId', []), set(skills.get('id', [])), 'skills.id')
+
+    targets = {
+        'CLASS': (set(units.get('classType', [])), 'units.classType'),
+        'TRIBE': (set(units.get('tribe', [])), 'units.tribe'),
+        'UNIT': (set(units.get('id', [])), 'units.id'),
+    }
+    groups, ids = synergies.get('group', []), synergies.get('id', [])
+    issues += validate_table('synergies', synergies, SYNERGY_SCHEMA)
+    for group, (target, label) in targets.items():
+        # giữ nguyên vị trí dòng: giá trị của group khác thay bằng phần tử hợp lệ
+        vals = [v if g == group else None for g, v in zip(groups, ids)]
+        issues += check_refs('synergies', 'id', vals, target | {None}, label)
+    return issues
+
+
+def format_issue(x):
+    return f'  {x.table}:{x.line} [{x.col}] {x.value!r}: {x.msg}'
+
+
+def main(data_dir=DATA_DIR, prof=None):
+    prof = prof or Profiler(None)
+
+    with prof.stage('load') as st:
+        skills, issues = read_table(os.path.join(data_dir, 'skills.csv'), 'skills')
+        units, unit_issues = read_table(os.path.join(data_dir, 'units.csv'), 'units')
+        synergies, synergy_issues = read_table(os.path.join(data_dir, 'synergies.csv'), 'synergies')
+        issues += unit_issues + synergy_issues
+        n = st.rows = sum(len(next(iter(t.values()), [])) for t in (skills, units, synergies))
+
+    with prof.stage('validate') as st:
+        issues += validate_catalog(skills, units, synergies)
+        st.rows = n
+
+    if issues:
+        for x in issues:
+            print(format_issue(x))
+        print(f'❌ {len(issues)} lỗi schema')
+        return 1
+    print('✅ skills.csv / units.csv / synergies.csv hợp lệ')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.stdout.reconfigure(encoding='utf-8')
+    prof = Profiler.from_argv('schema')
+    code = main(prof=prof)
+    if prof.write():
+        print(f'📊 Profile written to {prof.out_path}')
+    sys.exit(code)
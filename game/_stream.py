@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+Các stage generator cho pipeline phân tích dữ liệu (đọc -> lọc -> join -> format -> ghi).
+Mỗi stage nhận và trả iterator nên bộ nhớ không tăng theo kích thước file;
+riêng bước sắp xếp dùng external sort (chunk đã sort ghi ra file tạm rồi
+heapq.merge) nên chỉ giữ tối đa CHUNK_ROWS dòng trong RAM và mở tối đa
+MAX_FAN_IN file run cùng lúc.
+Đo thời gian / số dòng của từng stage: bọc generator bằng Profiler.stream (_instrument).
+"""
+import csv, heapq, os, pickle, tempfile
+from itertools import islice
+
+CHUNK_ROWS = 50_000
+MAX_FAN_IN = 64  # số run merge cùng lúc; giữ xa giới hạn file mở (ulimit -n 1024)
+
+
+def iter_rows(path):
+    """(header, iterator các dòng list) — file được đóng khi iterator chạy hết."""
+    f = open(path, encoding='utf-8', newline='')
+    reader = csv.reader(f)
+    header = next(reader, [])
+
+    def gen():
+        with f:
+            yield from reader
+    return header, gen()
+
+
+def iter_dicts(path):
+    with open(path, encoding='utf-8', newline='') as f:
+        yield from csv.DictReader(f)
+
+
+def where(rows, pred):
+    return (r for r in rows if pred(r))
+
+
+def _write_run(items, tmp_dir):
+    fd, path = tempfile.mkstemp(suffix='.run', dir=tmp_dir)
+    with os.fdopen(fd, 'wb') as f:
+        for item in items:
+            pickle.dump(item, f, pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def _spill(chunk, key, tmp_dir):
+    chunk.sort(key=key)
+    return _write_run(chunk, tmp_dir)
+
+
+def _read_run(path):
+    with open(path, 'rb') as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                break
+    os.remove(path)
+
+
+def _merge(runs, key):
+    # heapq.merge giữ thứ tự run khi key bằng nhau -> stable như sorted()
+    return heapq.merge(*(_read_run(p) for p in runs), key=key)
+
+
+def external_sort(items, key, chunk_rows=CHUNK_ROWS, max_fan_in=MAX_FAN_IN):
+    """Sort ổn định (stable) với bộ nhớ giới hạn; dữ liệu nhỏ thì sort thẳng trong RAM."""
+    items = iter(items)
+    first = list(islice(items, chunk_rows))
+    if len(first) < chunk_rows:
+        first.sort(key=key)
+        yield from first
+        return
+    tmp_dir = tempfile.mkdtemp(prefix='stream_sort_')
+    try:
+        runs = [_spill(first, key, tmp_dir)]
+        del first
+        while True:
+            chunk = list(islice(items, chunk_rows))
+            if not chunk:
+                break
+            runs.append(_spill(chunk, key, tmp_dir))
+        # quá nhiều run: merge từng nhóm run liền nhau thành run lớn hơn (vẫn stable)
+        while len(runs) > max_fan_in:
+            runs = [_write_run(_merge(runs[i:i + max_fan_in], key), tmp_dir)
+                    for i in range(0, len(runs), max_fan_in)]
+        yield from _merge(runs, key)
+    finally:
+        for name in os.listdir(tmp_dir):
+            os.remove(os.path.join(tmp_dir, name))
+        os.rmdir(tmp_dir)
+
+
+def join(rows, index, key, default=None):
+    """Hash join: (row, index.get(key(row))) — index là bảng nhỏ đã thu gọn."""
+    for r in rows:
+        yield r, index.get(key(r), default)
+
+
+def write_lines(lines, path, sep='\n'):
+    """Ghi từng dòng ngay khi được sinh ra (không thêm sep ở cuối); trả về số dòng."""
+    n = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        for line in lines:
+            if n:
+                f.write(sep)
+            f.write(line)
+            n += 1
+    return n
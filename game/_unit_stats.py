@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+Ma trận chỉ số unit (hp/atk/def/matk/mdef/range/rageMax) trên NumPy.
+- power score: chỉ số chia cho median của tier (so sánh được giữa các tier),
+  gộp theo POWER_WEIGHTS
+- z-score theo nhóm (tier, class) kiểu leave-one-out: so mỗi unit với median các
+  peer còn lại của nhóm, không tính chính nó; độ phân tán đo gộp cả tier
+- percentile, outlier (>= N sigma), nearest neighbour, stat curve theo tier
+Chạy: python _unit_stats.py [--tier 3] [--class FIGHTER] [--sigma 2] [--near wolf_alpha]
+"""
+import os, sys
+
+import numpy as np
+
+from _instrument import Profiler
+from _schema import read_columns
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+UNITS_PATH = os.path.join(HERE, 'data', 'units.csv')
+STAT_COLS = ['hp', 'atk', 'def', 'matk', 'mdef', 'range', 'rageMax']
+# rageMax thấp = ra skill sớm hơn nên trọng số âm
+POWER_WEIGHTS = {'hp': 1.0, 'atk': 1.0, 'def': 1.0, 'matk': 1.0, 'mdef': 1.0, 'range': 0.5, 'rageMax': -0.5}
+PCTS = [10, 50, 90]
+MAD_SCALE = 1.4826  # MAD -> std với phân phối chuẩn
+
+
+def _loo_median(v):
+    """Median của các hàng còn lại khi bỏ từng hàng của v (n x k, n >= 2)."""
+    n, k = v.shape
+    order = np.argsort(v, axis=0, kind='stable')
+    srt = np.take_along_axis(v, order, axis=0)
+    rank = np.empty_like(order)
+    np.put_along_axis(rank, order, np.broadcast_to(np.arange(n)[:, None], (n, k)), axis=0)
+
+    def pick(p):
+        # vị trí p trong dãy đã bỏ phần tử hạng `rank` -> vị trí trong srt
+        return np.take_along_axis(srt, p + (p >= rank), axis=0)
+    m = n - 1
+    return (pick(np.full_like(rank, (m - 1) // 2)) + pick(np.full_like(rank, m // 2))) / 2
+
+
+def peer_zscores(codes, n_groups, values, strata):
+    """z-score leave-one-out: (x - median peer) / độ phân tán của hiệu đó trong strata.
+    Nhóm (tier, class) chỉ có 3-4 unit nên tâm là median peer (một unit lệch không kéo
+    peer của nó theo), độ phân tán đo gộp cả strata (tier): MAD, MAD = 0 thì dùng RMS.
+    Unit không có peer hoặc strata không lệch chút nào: z = 0."""
+    dev = np.zeros_like(values)
+    has_peers = np.zeros(len(values), dtype=bool)
+    for g in range(n_groups):
+        idx = np.flatnonzero(codes == g)
+        if len(idx) > 1:
+            dev[idx] = values[idx] - _loo_median(values[idx])
+            has_peers[idx] = True
+    z = np.zeros_like(values)
+    for t in np.unique(strata):
+        m = (strata == t) & has_peers
+        if not m.any():
+            continue
+        d = dev[m]
+        sigma = MAD_SCALE * np.median(np.abs(d), axis=0)
+        sigma = np.where(sigma > 0, sigma, np.sqrt((d * d).mean(axis=0)))
+        ok = sigma > 0
+        z[np.ix_(np.flatnonzero(m), np.flatnonzero(ok))] = d[:, ok] / sigma[ok]
+    return z
+
+
+class UnitStats:
+    def __init__(self, ids, tiers, classes, matrix):
+        self.ids = np.asarray(ids)
+        self.tiers = np.asarray(tiers, dtype=np.int8)
+        self.classes = np.asarray(classes)
+        self.matrix = np.asarray(matrix, dtype=float)
+        self.row_of = {uid: i for i, uid in enumerate(self.ids.tolist())}
+
+        # chuẩn hóa theo median của tier
+        tier_vals, tier_codes = np.unique(self.tiers, return_inverse=True)
+        med = np.vstack([np.median(self.matrix[tier_codes == i], axis=0) for i in range(len(tier_vals))])
+        med[med == 0] = 1.0
+        self.ratio = self.matrix / med[tier_codes]
+
+        w = np.array([POWER_WEIGHTS[c] for c in STAT_COLS])
+        self.power = (self.ratio * w).sum(axis=1) / np.abs(w).sum()
+
+        # nhóm (tier, class)
+        keys = np.char.add(self.tiers.astype(str), self.classes.astype(str))
+        _, self.group, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        self.n_groups = len(counts)
+        values = np.column_stack([self.matrix, self.power])
+        self.z = peer_zscores(self.group, self.n_groups, values, self.tiers)
+
+    @classmethod
+    def load(cls, path=UNITS_PATH):
+        cols = read_columns(path)
+        matrix = np.column_stack([np.asarray(cols[c], dtype=float) for c in STAT_COLS])
+        return cls(cols['id'], np.asarray(cols['tier'], dtype=int), cols['classType'], matrix)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _col(self, stat):
+        return len(STAT_COLS) if stat == 'power' else STAT_COLS.index(stat)
+
+    def _mask(self, tier=None, cls=None):
+        m = np.ones(len(self), dtype=bool)
+        if tier is not None:
+            m &= self.tiers == tier
+        if cls is not None:
+            m &= self.classes == cls
+        return m
+
+    def values(self, stat='power'):
+        return self.power if stat == 'power' else self.matrix[:, self._col(stat)]
+
+    def zscores(self, stat='power'):
+        return self.z[:, self._col(stat)]
+
+    def percentile(self, stat='power', tier=None, cls=None):
+        """Percentile rank (0-100) của từng unit trong tập đã lọc -> (ids, pct)."""
+        m = self._mask(tier, cls)
+        v = self.values(stat)[m]
+        srt = np.sort(v)
+        # giá trị bằng nhau nhận hạng trung bình -> cùng một percentile
+        ranks = (np.searchsorted(srt, v, 'left') + np.searchsorted(srt, v, 'right') - 1) / 2
+        pct = 100.0 * ranks / max(len(v) - 1, 1)
+        return self.ids[m], pct
+
+    def outliers(self, sigma=2.0, stat='power', tier=None, cls=None, below=False):
+        """Unit lệch >= sigma so với peer cùng tier+class -> list (id, tier, class, z)."""
+        z = self.zscores(stat)
+        hit = self._mask(tier, cls) & ((z <= -sigma) if below else (z >= sigma))
+        idx = np.flatnonzero(hit)
+        idx = idx[np.argsort(-np.abs(z[idx]))]
+        return [(str(self.ids[i]), int(self.tiers[i]), str(self.classes[i]), float(z[i])) for i in idx]
+
+    def nearest(self, uid, k=5, same_tier=False):
+        """k unit có vector chỉ số (đã chuẩn hóa theo tier) gần nhất."""
+        i = self.row_of[uid]
+        d = np.sqrt(((self.ratio - self.ratio[i]) ** 2).sum(axis=1))
+        d[i] = np.inf
+        if same_tier:
+            d[self.tiers != self.tiers[i]] = np.inf
+        k = min(k, int(np.isfinite(d).sum()))
+        idx = np.argpartition(d, k - 1)[:k] if k else np.array([], dtype=int)
+        idx = idx[np.argsort(d[idx])]
+        return [(str(self.ids[j]), float(d[j])) for j in idx]
+
+    def curves(self):
+        """Stat curve theo tier: {stat: array (n_tier x [mean, p10, p50, p90])}, tiers."""
+        tiers = np.unique(self.tiers)
+        out = {}
+        values = np.column_stack([self.matrix, self.power])
+        for c, stat in enumerate(STAT_COLS + ['power']):
+            rows = []
+            for t in tiers:
+                v = values[self.tiers == t, c]
+                rows.append([v.mean(), *np.percentile(v, PCTS)])
+            out[stat] = np.array(rows)
+        return out, tiers
+
+
+def format_curves(curves, tiers):
+    lines = [f"{'stat':8s} {'tier':>4s} {'mean':>9s} {'p10':>9s} {'p50':>9s} {'p90':>9s}"]
+    for stat, arr in curves.items():
+        for t, (mean, p10, p50, p90) in zip(tiers, arr):
+            lines.append(f'{stat:8s} {t:>4d} {mean:>9.2f} {p10:>9.2f} {p50:>9.2f} {p90:>9.2f}')
+    return lines
+
+
+def _arg(argv, flag, default=None):
+    if flag in argv:
+        i = argv.index(flag)
+        return argv[i + 1]
+    return default
+
+
+def main(argv=None, path=UNITS_PATH, prof=None):
+    argv = sys.argv[1:] if argv is None else argv
+    prof = prof or Profiler(None)
+    tier = _arg(argv, '--tier')
+    tier = int(tier) if tier else None
+    cls = _arg(argv, '--class')
+    sigma = float(_arg(argv, '--sigma', 2))
+    near = _arg(argv, '--near')
+
+    with prof.stage('load') as st:
+        us = UnitStats.load(path)
+        st.rows = len(us)
+
+    with prof.stage('validate') as st:
+        curves, tiers = us.curves()
+        above = us.outliers(sigma, tier=tier, cls=cls)
+        below = us.outliers(sigma, tier=tier, cls=cls, below=True)
+        st.rows = len(us)
+
+    for line in format_curves(curves, tiers):
+        print(line)
+    label = f"T{tier or '*'} {cls or '*'}"
+    print(f'\n=== {label}: power >= {sigma}σ so với peer ===')
+    for uid, t, c, z in above:
+        print(f'  T{t} {c:9s} {uid:25s} z={z:+.2f}')
+    print(f'=== {label}: power <= -{sigma}σ so với peer ===')
+    for uid, t, c, z in below:
+        print(f'  T{t} {c:9s} {uid:25s} z={z:+.2f}')
+    if near:
+        print(f'\n=== gần {near} nhất ===')
+        for uid, d in us.nearest(near):
+            print(f'  {uid:25s} d={d:.3f}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.stdout.reconfigure(encoding='utf-8')
+    prof = Profiler.from_argv('unit_stats')
+    code = main(prof=prof)
+    if prof.write():
+        print(f'📊 Profile written to {prof.out_path}')
+    sys.exit(code)
@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+"""Test cho các script dữ liệu Python (_*.py) ở thư mục game/.
+Chạy: python -m pytest -q tests/py
+"""
+import os, sys
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if GAME_DIR not in sys.path:
+    sys.path.insert(0, GAME_DIR)
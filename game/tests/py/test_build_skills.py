@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+import contextlib, csv, io, os
+
+import _build_skills
+from _skill_data import ALL_SKILLS, COLS
+
+SKILLS_CSV = os.path.join(os.path.dirname(_build_skills.__file__), 'data', 'skills.csv')
+
+
+def _read(path):
+    with open(path, encoding='utf-8', newline='') as f:
+        return list(csv.reader(f))
+
+
+def test_skill_data_in_sync_with_csv(tmp_path):
+    """_build_skills.py ghi đè data/skills.csv nên _skill_data.py phải sinh ra đúng nội dung đó."""
+    out = tmp_path / 'skills.csv'
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert _build_skills.main(out_path=str(out)) == 0
+    built, tracked = _read(out), _read(SKILLS_CSV)
+    assert built[0] == COLS == tracked[0]
+    assert [r[0] for r in built] == [r[0] for r in tracked]
+    assert built == tracked
+
+
+def test_skill_data_validates():
+    assert _build_skills.validate(ALL_SKILLS, COLS) == []
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+import json, os, shutil, threading
+
+import pytest
+
+import _catalog_daemon
+from _catalog_daemon import FILES, Catalog, CatalogService, Client, make_server
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    for name in FILES:
+        shutil.copy(os.path.join(_catalog_daemon.DATA_DIR, name), tmp_path / name)
+    monkeypatch.setattr(_catalog_daemon, 'RELOAD_CHECK_S', 0)
+    return tmp_path
+
+
+def _get(service, path, query=''):
+    status, body = service.answer(path, query)
+    return status, json.loads(body)
+
+
+def _touch(path, text):
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(text)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))  # mtime chắc chắn đổi
+
+
+def test_routes(data_dir):
+    svc = CatalogService(str(data_dir))
+    status, unit = _get(svc, '/unit/bear_ancient')
+    assert status == 200 and unit['id'] == 'bear_ancient'
+    status, skill = _get(svc, f"/skill/{unit['skillId']}")
+    assert status == 200 and skill['id'] == unit['skillId']
+    status, same = _get(svc, '/skills', f"effect={skill['effect']}")
+    assert status == 200 and skill['id'] in [s['id'] for s in same]
+    assert _get(svc, '/synergy', 'count=5&group=CLASS&id=TANKER') == (
+        200, {'group': 'CLASS', 'id': 'TANKER', 'threshold': 4, 'bonus': {'defFlat': 16, 'mdefFlat': 12}})
+    assert _get(svc, '/synergy', 'count=1&group=CLASS&id=TANKER')[1]['threshold'] is None
+    assert _get(svc, '/unit-skills', 'id=bear_ancient') == (200, unit['skillId'])
+    assert _get(svc, '/unit/nope')[0] == 404
+    assert _get(svc, '/synergy', 'count=x&group=CLASS&id=TANKER')[0] == 400
+    assert _get(svc, '/whatever')[0] == 400
+
+
+def test_cache_hits_and_reload_on_mtime(data_dir):
+    svc = CatalogService(str(data_dir))
+    _get(svc, '/unit/bear_ancient')
+    _get(svc, '/unit/bear_ancient')
+    assert svc.stats()['cache']['hits'] == 1
+    assert not svc.maybe_reload()  # file chưa đổi
+
+    assert _get(svc, '/synergy', 'count=3&group=CLASS&id=NEWCLS')[0] == 404
+    _touch(data_dir / 'synergies.csv', 'CLASS,NEWCLS,,2,"{""atkPct"":5}"\n')
+    assert svc.maybe_reload()
+    assert svc.reloads == 1
+    assert svc.stats()['cache']['size'] == 0  # cache cũ bị xóa
+    assert _get(svc, '/synergy', 'count=3&group=CLASS&id=NEWCLS') == (
+        200, {'group': 'CLASS', 'id': 'NEWCLS', 'threshold': 2, 'bonus': {'atkPct': 5}})
+
+
+def test_half_written_file_keeps_old_catalog(data_dir, capsys):
+    svc = CatalogService(str(data_dir))
+    old = svc.catalog
+    _touch(data_dir / 'synergies.csv', 'CLASS,NEWCLS\n')  # dòng ghi dở: thiếu threshold/bonus
+    assert not svc.maybe_reload()
+    assert svc.catalog is old
+    assert 'reload failed' in capsys.readouterr().err
+    with pytest.raises(ValueError, match='synergies.csv'):
+        Catalog(str(data_dir))
+    assert _get(svc, '/unit/bear_ancient')[0] == 200
+
+
+def test_http_server_survives_bad_reload(data_dir):
+    server = make_server(CatalogService(str(data_dir)), port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    client = Client(port=server.server_address[1])
+    try:
+        assert client.query('/unit/bear_ancient')['id'] == 'bear_ancient'
+        _touch(data_dir / 'synergies.csv', 'CLASS,NEWCLS\n')
+        assert client.query('/unit/bear_ancient')['id'] == 'bear_ancient'
+        with pytest.raises(LookupError, match='404'):
+            client.query('/unit/nope')
+        assert client.query('/stats')['reloads'] == 0
+    finally:
+        client.close()
+        server.shutdown()
+        server.server_close()
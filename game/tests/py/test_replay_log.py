@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+import json, os
+
+import numpy as np
+import pytest
+
+import _replay_log
+from _replay_log import EVENT_DTYPE, HEADER_SIZE, ReplayWriter, open_log
+
+
+def _fight(w, fight):
+    w.event(fight, 1, 'wolf_alpha', 'bear_ancient', skill='wolf_bite', damage=30, crit=True)
+    w.event(fight, 1, 'bear_ancient', 'wolf_alpha', skill='bear_roar', damage=12, status='stun')
+    w.event(fight, 2, 'wolf_alpha', 'bear_ancient', damage=50, death=True)
+
+
+def test_write_reopen_append_and_aggregate(tmp_path):
+    path = str(tmp_path / 'fights.bin')
+    with ReplayWriter(path, buffer_events=2) as w:
+        _fight(w, 1)
+    with ReplayWriter(path) as w:
+        _fight(w, 2)
+        w.event(3, 1, 'ant_guard', 'wolf_alpha', skill='wolf_bite', damage=5, miss=True)
+    assert w.written == 4
+
+    log = open_log(path)
+    names = log.tables
+    assert len(log) == 7
+    assert log.fights() == 3
+    assert names['units'] == ['', 'wolf_alpha', 'bear_ancient', 'ant_guard']
+    dmg = dict(zip(names['skills'], log.damage_by_skill()))
+    assert dmg == {'': 100.0, 'wolf_bite': 65.0, 'bear_roar': 24.0}
+    assert dict(zip(names['units'], log.deaths_by_unit()))['bear_ancient'] == 2
+    assert dict(zip(names['units'], log.kills_by_unit()))['wolf_alpha'] == 2
+    assert log.status_landing(['bear_roar'], 'stun') == (2, 2)
+    assert log.status_landing(['wolf_bite'], 'stun') == (3, 0)
+
+
+def test_reopen_truncates_torn_record(tmp_path):
+    path = str(tmp_path / 'fights.bin')
+    with ReplayWriter(path) as w:
+        _fight(w, 1)
+    with open(path, 'ab') as f:
+        f.write(b'\x07' * 5)  # crash giữa lúc ghi record
+    with ReplayWriter(path) as w:
+        _fight(w, 2)
+    size = (tmp_path / 'fights.bin').stat().st_size
+    assert (size - HEADER_SIZE) % EVENT_DTYPE.itemsize == 0
+    log = open_log(path)
+    assert log.events['fight'].tolist() == [1, 1, 1, 2, 2, 2]
+    assert log.damage_by_skill().sum() == 184
+
+
+def test_sidecar_is_written_before_records(tmp_path, monkeypatch):
+    path = str(tmp_path / 'fights.bin')
+    w = ReplayWriter(path)
+    _fight(w, 1)
+    w.flush()
+    size_before = os.path.getsize(path)
+    seen = []
+    real_replace = os.replace
+
+    def replace(src, dst):
+        real_replace(src, dst)
+        with open(dst, encoding='utf-8') as f:
+            seen.append((os.path.getsize(path), 'new_unit' in json.load(f)['units']))
+    monkeypatch.setattr(_replay_log.os, 'replace', replace)
+    w.event(2, 1, 'new_unit', skill='new_skill')
+    w.flush()
+    w.close()
+    # lúc bảng mã mới đã nằm trên đĩa, record dùng mã đó chưa được ghi
+    assert seen[0] == (size_before, True)
+
+
+def test_codes_beyond_table_are_an_error(tmp_path):
+    path = str(tmp_path / 'fights.bin')
+    with ReplayWriter(path) as w:
+        _fight(w, 1)
+        bad = np.zeros(1, EVENT_DTYPE)
+        bad['skill'] = 99
+        w.extend(bad)
+    with pytest.raises(ValueError, match='vượt bảng'):
+        open_log(path).uses_by_skill()
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+import copy, json
+
+import pytest
+
+import _save_tool
+from _save_tool import migrate_save_data, run
+
+UNIT_IDS = {'bear_ancient', 'wolf_alpha', 'ant_guard'}
+
+
+def _save(player, version=1):
+    return {'version': version, 'savedAt': 0, 'payload': {'player': player}}
+
+
+def _unit(base_id, **statuses):
+    return {'baseId': base_id, 'star': 1, 'statuses': statuses}
+
+
+# (tên, save, migrationLog mong đợi, player sau migrate (các key cần so)) — kết quả lấy từ
+# migrateSaveData của src/core/persistence.js chạy bằng node (sau JSON.stringify)
+CASES = [
+    ('v1_full', _save({
+        'level': 12, 'round': 4, 'hp': 3, 'gold': 10,
+        'board': [[None, _unit('bear_ancient', slowTurns=2)], [_unit('old_unit'), None]],
+        'bench': [None, _unit('wolf_alpha', hasteTurns=1, slowTurns=0), _unit('gone_unit'), _unit('ant_guard')],
+        'shop': [{'baseId': 'ant_guard', 'cost': 1}, {'baseId': 'gone_shop', 'cost': 2}, None],
+    }), [
+        'Migrating save data from version 1 to version 2',
+        'WARNING: Level 12 exceeds old cap of 9, clamping to 25',
+        'Migrated legacy speed statuses for unit bear_ancient at board[0][1]',
+        'Removed invalid unit old_unit from board[1][0]',
+        'Migrated legacy speed statuses for unit wolf_alpha on bench[1]',
+        'Removed invalid unit gone_unit from bench[2]',
+        'Removed invalid unit gone_shop from shop[1]',
+        'Migration to version 2 complete',
+    ], {
+        'level': 12,
+        'board': [[None, _unit('bear_ancient', evadeDebuffTurns=2, evadeDebuffValue=0.15)], [None, None]],
+        'bench': [_unit('wolf_alpha', evadeBuffTurns=1, evadeBuffValue=0.10), _unit('ant_guard')],
+        'shop': [{'baseId': 'ant_guard', 'cost': 1}, None, None],
+    }),
+    ('version_null', _save({'level': 3}, version=None), [
+        'Migrating save data from version 1 to version 2',
+        'Migration to version 2 complete',
+    ], {'level': 3, 'round': 1, 'hp': 3, 'gold': 0}),
+    ('version_string', _save({'level': '30'}, version='1'), [
+        'Migrating save data from version 1 to version 2',
+        'WARNING: Level 30 exceeds old cap of 9, clamping to 25',
+        'Migration to version 2 complete',
+    ], {'level': 25}),
+    ('v2_clamps', _save({'level': 40, 'round': 0, 'hp': -5, 'gold': -3, 'deployCapBonus': 150}, version=2), [
+        'WARNING: Invalid deployCapBonus 150, resetting to 0',
+    ], {'level': 25, 'round': 1, 'hp': 0, 'gold': 0, 'deployCapBonus': 0}),
+    ('v2_untouched', _save({'level': 5, 'round': 7, 'hp': 2, 'gold': 31, 'board': [[_unit('old_unit', slowTurns=1)]]},
+                           version=2), [], {
+        'level': 5, 'round': 7, 'hp': 2, 'gold': 31, 'board': [[_unit('old_unit', slowTurns=1)]],
+    }),
+    ('v2_string_numbers', _save({'level': '7', 'gold': 'abc', 'deployCapBonus': '-1'}, version=2), [
+        'WARNING: Invalid deployCapBonus -1, resetting to 0',
+    ], {'level': 7, 'gold': None, 'deployCapBonus': 0}),
+]
+
+BROKEN = [
+    ('not_object', 'x', 'ERROR: Save data is corrupted or invalid'),
+    ('array', ['x'], 'ERROR: Save payload is corrupted'),
+    ('array_payload', {'payload': [1]}, 'ERROR: Player data is corrupted'),
+    ('no_payload', {'version': 1}, 'ERROR: Save payload is corrupted'),
+    ('no_player', {'version': 1, 'payload': {'player': None}}, 'ERROR: Player data is corrupted'),
+]
+
+
+@pytest.mark.parametrize('name,save,log,player', CASES, ids=[c[0] for c in CASES])
+def test_migrate_matches_persistence_js(name, save, log, player):
+    data, got = migrate_save_data(copy.deepcopy(save), UNIT_IDS)
+    assert got == log
+    assert data['version'] == (2 if log and log[0].startswith('Migrating') else save['version'])
+    out = data['payload']['player']
+    assert {k: out.get(k) for k in player} == player
+
+
+@pytest.mark.parametrize('name,save,msg', BROKEN, ids=[c[0] for c in BROKEN])
+def test_migrate_rejects_corrupt_saves(name, save, msg):
+    assert migrate_save_data(save, UNIT_IDS) == (None, [msg])
+
+
+def test_migrate_uses_replacement_map(monkeypatch):
+    monkeypatch.setitem(_save_tool.UNIT_REPLACEMENT_MAP, 'old_wolf', 'wolf_alpha')
+    save = _save({'board': [[_unit('old_wolf')]], 'bench': [_unit('old_wolf')], 'shop': [{'baseId': 'old_wolf'}]})
+    data, log = migrate_save_data(save, UNIT_IDS)
+    assert log[1:-1] == [
+        'Replaced removed unit old_wolf with wolf_alpha at board[0][0]',
+        'Replaced removed unit old_wolf with wolf_alpha on bench[0]',
+        'Replaced removed unit old_wolf with wolf_alpha in shop[0]',
+    ]
+    player = data['payload']['player']
+    assert [player['board'][0][0]['baseId'], player['bench'][0]['baseId'], player['shop'][0]['baseId']] == ['wolf_alpha'] * 3
+
+
+def test_run_survives_corrupt_files(tmp_path):
+    saves = tmp_path / 'saves'
+    saves.mkdir()
+    (saves / 'v1.json').write_text(json.dumps(_save({'level': 2, 'round': 3, 'board': [[_unit('bear_ancient')]]})))
+    (saves / 'v2.json').write_text(json.dumps(_save({'level': 4, 'round': 9}, version=2)))
+    (saves / 'null_version.json').write_text(json.dumps(_save({'level': 1}, version=None)))
+    (saves / 'double.txt').write_text(json.dumps(json.dumps(_save({'level': 5}, version=2))))
+    (saves / 'bad_json.json').write_text('{"version": 1, "payload": ')
+    (saves / 'bad_flatted.save').write_text('[{"a":"5"}]')
+    (saves / 'ignored.md').write_text('not a save')
+
+    out = tmp_path / 'out'
+    rep = run(str(saves), out_dir=str(out), workers=2, chunksize=1).as_dict()
+    assert rep['files'] == 6
+    assert rep['failed'] == 2
+    assert rep['errors'] == {'JSONDecodeError': 1, 'IndexError': 1}
+    assert rep['migrated'] == 2
+    assert rep['versions'] == {'1': 2, '2': 2}
+    assert rep['top_units'] == [('bear_ancient', 1)]
+    assert sorted(p.name for p in out.iterdir()) == ['double.txt', 'null_version.json', 'v1.json', 'v2.json']
+    assert json.loads((out / 'null_version.json').read_text())['version'] == 2
+
+
+def test_run_survives_odd_values(tmp_path):
+    saves = tmp_path / 'saves'
+    saves.mkdir()
+    (saves / 'nan_gold.json').write_text(json.dumps(_save({'level': 3, 'gold': 'abc'}, version=2)))
+    (saves / 'gold.json').write_text(json.dumps(_save({'level': 3, 'gold': 10}, version=2)))
+    (saves / 'list_version.json').write_text(json.dumps(_save({'level': 2, 'gold': 10}, version=[2])))
+    (saves / 'no_payload.json').write_text(json.dumps({'version': 2}))
+    (saves / 'no_player.json').write_text(json.dumps({'version': 2, 'payload': {}}))
+    (saves / 'bad_flatted.save').write_text('[{"a":"5"}]')
+
+    rep = run(str(saves), workers=2, chunksize=1).as_dict()
+    assert rep['files'] == 6
+    assert rep['failed'] == 3
+    assert rep['errors'] == {
+        'ERROR: Save payload is corrupted': 1,
+        'ERROR: Player data is corrupted': 1,
+        'IndexError': 1,
+    }
+    assert rep['versions'] == {'2': 2, '[2]': 1}
+    assert rep['gold'] == {'min': 10, 'max': 10, 'mean': 10.0, 'p50': 10, 'p90': 10}
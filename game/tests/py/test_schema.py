@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from _schema import SKILL_SCHEMA, check_widths, columns_of, read_columns, read_table
+
+HEADER = ['id', 'name', 'descriptionVi', 'actionPattern']
+
+
+def test_check_widths_reports_extra_and_missing_cells():
+    rows = [
+        ['a', 'A', 'ok', 'SELF'],
+        ['b', 'B', 'gây ST', ' rồi choáng', 'SELF'],  # dấu phẩy không quote
+        ['c', 'C'],
+    ]
+    issues = check_widths('skills', HEADER, rows)
+    assert [(x.line, x.value, x.msg) for x in issues] == [
+        (3, 'b', '5 ô, header có 4'),
+        (4, 'c', '2 ô, header có 4'),
+    ]
+
+
+def test_columns_of_pads_short_rows():
+    assert columns_of(HEADER, [['a', 'A']])['actionPattern'] == ['']
+
+
+def test_read_table_flags_unquoted_comma(tmp_path):
+    path = tmp_path / 'skills.csv'
+    path.write_text('id,name,descriptionVi,actionPattern\n'
+                    'a,A,"mô tả, có quote",SELF\n'
+                    'b,B,mô tả, không quote,SELF\n', encoding='utf-8')
+    columns, issues = read_table(str(path), 'skills')
+    assert columns['descriptionVi'] == ['mô tả, có quote', 'mô tả']
+    assert [(x.table, x.line, x.value) for x in issues] == [('skills', 3, 'b')]
+    with pytest.raises(ValueError, match='skills.csv:3'):
+        read_columns(str(path))
+
+
+@pytest.mark.parametrize('col,value', [
+    ('base', 'inf'), ('base', '1e999'), ('base', 'nan'), ('base', '1_000'), ('stunChance', '-inf'),
+    ('buffStats', '{"atk": NaN}'), ('buffStats', '{"atk": Infinity}'), ('buffStats', '{"atk": 1e999}'),
+    ('hit1', '0.5'), ('hit1', '{"base": NaN}'), ('hit2', '{"base": 10, "scaleStat": "luck"}'),
+    ('hit2', '{"scaleStat": "atk"}'), ('hit1', '{"base": 10, "dmg": 1}'),
+])
+def test_rejects_values_the_game_drops(col, value):
+    required, check = SKILL_SCHEMA[col]
+    assert check(value) is not None
+
+
+@pytest.mark.parametrize('col,value', [
+    ('base', '25'), ('scale', '1.45'), ('buffStats', '{"atk": 5, "def": 0.1}'),
+    ('hit1', '{"base": 26, "scaleStat": "atk", "scale": 1.45}'), ('hit2', '{"scale": 1.2}'),
+])
+def test_accepts_values_the_game_reads(col, value):
+    required, check = SKILL_SCHEMA[col]
+    assert check(value) is None
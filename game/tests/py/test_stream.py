@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+import os, random, time
+
+import _stream
+from _instrument import Profiler
+from _stream import external_sort
+
+
+def test_external_sort_in_memory_is_stable():
+    items = [(i % 3, i) for i in range(20)]
+    assert list(external_sort(items, key=lambda x: x[0], chunk_rows=100)) == sorted(items, key=lambda x: x[0])
+
+
+def test_external_sort_multi_pass_merge_is_stable(monkeypatch):
+    rng = random.Random(7)
+    items = [(rng.randrange(10), i) for i in range(1000)]
+    opened = []
+    read_run = _stream._read_run
+
+    def tracking(path):
+        opened.append(path)
+        return read_run(path)
+    monkeypatch.setattr(_stream, '_read_run', tracking)
+    # 100 run, fan-in 4 -> 25 -> 7 -> 2 -> kết quả
+    out = list(external_sort(iter(items), key=lambda x: x[0], chunk_rows=10, max_fan_in=4))
+    assert out == sorted(items, key=lambda x: x[0])
+    assert len(opened) == 100 + 25 + 7 + 2
+
+
+def test_external_sort_cleans_up_temp_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(_stream.tempfile, 'tempdir', str(tmp_path))
+    assert len(list(external_sort(range(100, 0, -1), key=lambda x: x, chunk_rows=7, max_fan_in=3))) == 100
+    assert os.listdir(tmp_path) == []
+
+
+def _slow(items, secs):
+    for x in items:
+        time.sleep(secs)
+        yield x
+
+
+def test_stream_stages_time_exclusive(tmp_path):
+    prof = Profiler('test', str(tmp_path / 'p.json'))
+    with prof.stage('write') as st:
+        inner = prof.stream('inner', _slow(range(5), 0.01))
+        outer = prof.stream('outer', _slow(inner, 0.02))
+        st.rows = sum(1 for _ in outer)
+    by_name = {s.name: s for s in prof.stages}
+    assert [s.name for s in prof.stages] == ['inner', 'outer', 'write']
+    assert by_name['inner'].rows == by_name['outer'].rows == 5
+    assert 0.05 <= by_name['inner'].wall < 0.09
+    assert 0.10 <= by_name['outer'].wall < 0.14
+    assert by_name['write'].wall < 0.02
+    rep = prof.report()
+    assert 'rows' not in rep['total']
+    assert rep['memory_traced'] is False
+
+
+def test_stream_disabled_returns_items_unchanged():
+    items = iter([1, 2])
+    assert Profiler(None).stream('x', items) is items
+
+
+def _alloc(items, size):
+    for x in items:
+        buf = bytearray(size)
+        yield x
+        del buf
+
+
+def test_stream_stages_trace_memory(tmp_path):
+    prof = Profiler('test', str(tmp_path / 'p.json'), memory=True)
+    try:
+        with prof.stage('write') as st:
+            inner = prof.stream('inner', _alloc(range(3), 1 << 20))
+            outer = prof.stream('outer', (x for x in inner))
+            st.rows = sum(1 for _ in outer)
+    finally:
+        rep = prof.write()
+    peaks = {s['name']: s['peak_bytes'] for s in rep['stages']}
+    assert rep['memory_traced'] is True
+    assert all(p is not None for p in peaks.values())
+    assert peaks['inner'] >= 1 << 20
+    assert peaks['outer'] >= 1 << 20  # peak tính cả stage con, như stage()
+    assert peaks['write'] >= 1 << 20
+    assert rep['total']['peak_bytes'] == max(peaks.values())
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from _unit_stats import STAT_COLS, UnitStats, peer_zscores
+
+CLASSES = ['TANKER', 'FIGHTER', 'MAGE', 'ARCHER', 'ASSASSIN', 'SUPPORT']
+
+
+def _roster(seed=4, per_group=4, tiers=(1, 2, 3)):
+    """Roster giả: mỗi (tier, class) có per_group unit quanh cùng một chỉ số, nhiễu ~3%."""
+    rng = np.random.default_rng(seed)
+    ids, tier_col, cls_col, rows = [], [], [], []
+    base = np.array([300, 40, 25, 10, 20, 2, 4], dtype=float)
+    for t in tiers:
+        for c in CLASSES:
+            for i in range(per_group):
+                ids.append(f'{c.lower()}_{t}_{i}')
+                tier_col.append(t)
+                cls_col.append(c)
+                rows.append(np.round(base * t * rng.normal(1, 0.03, len(base))))
+    return ids, tier_col, cls_col, np.array(rows)
+
+
+def test_planted_outlier_is_the_only_hit():
+    ids, tiers, classes, matrix = _roster()
+    i = ids.index('fighter_3_2')
+    matrix[i, STAT_COLS.index('atk')] *= 1.6
+    us = UnitStats(ids, tiers, classes, matrix)
+    assert [u for u, *_ in us.outliers(3, stat='atk')] == ['fighter_3_2']
+    assert [u for u, *_ in us.outliers(3, stat='atk', below=True)] == []
+    hits = {u for u, *_ in us.outliers(2, stat='atk')} | {u for u, *_ in us.outliers(2, stat='atk', below=True)}
+    assert 'fighter_3_2' in hits and len(hits) <= 6  # còn lại là nhiễu, ~5% của 72 unit
+
+
+def test_no_outliers_in_clean_roster():
+    us = UnitStats(*_roster(seed=11))
+    assert us.outliers(3) == [] and us.outliers(3, below=True) == []
+
+
+def test_identical_peers_still_flag_deviant_unit():
+    # nhóm 0: 3 peer giống hệt + 1 unit lệch; nhóm 1-3 cho tier có độ phân tán
+    values = np.array([10, 10, 10, 14, 9, 10, 11, 10, 10, 9, 11, 10, 11, 10, 9, 10], dtype=float)[:, None]
+    codes = np.repeat(np.arange(4), 4)
+    z = peer_zscores(codes, 4, values, np.ones(16))
+    assert z[3, 0] > 3
+    assert np.all(np.abs(z[:3, 0]) < 2)
+
+
+def test_zero_variance_and_singletons():
+    codes = np.array([0, 0, 0, 1])
+    z = peer_zscores(codes, 2, np.full((4, 1), 5.0), np.ones(4))
+    assert np.all(z == 0)
+    z = peer_zscores(codes, 2, np.array([[1.0], [1.0], [4.0], [100.0]]), np.ones(4))
+    assert np.all(np.isfinite(z)) and z[3, 0] == 0  # unit không có peer
+
+
+def test_percentile_ties_share_rank():
+    matrix = np.ones((5, len(STAT_COLS)))
+    matrix[:, STAT_COLS.index('range')] = [1, 1, 1, 3, 2]
+    us = UnitStats(list('abcde'), [1] * 5, ['TANKER'] * 5, matrix)
+    ids, pct = us.percentile('range')
+    assert dict(zip(ids.tolist(), pct.tolist())) == {'a': 25.0, 'b': 25.0, 'c': 25.0, 'd': 100.0, 'e': 75.0}
+    _, pct = us.percentile('hp')
+    assert np.all(pct == 50.0)